@@ -8,12 +8,38 @@ Version: 2.0.0
 """
 import sqlite3
 import json
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 DEFAULT_DB_PATH = 'shockwave_planner.db'
 
+# Launch rows joined with their site, rocket and status in a single query
+LAUNCH_SELECT = '''
+    SELECT l.*, 
+           ls.location, ls.launch_pad, ls.country, ls.latitude, ls.longitude,
+           r.name as rocket_name,
+           st.status_name, st.status_color
+    FROM launches l
+    LEFT JOIN launch_sites ls ON l.site_id = ls.site_id
+    LEFT JOIN rockets r ON l.rocket_id = r.rocket_id
+    LEFT JOIN launch_status st ON l.status_id = st.status_id
+'''
+
+# Day-of-month x-axis labels, sliced per month instead of formatted per day
+DAY_LABELS = [str(day) for day in range(1, 32)]
+
+# English month abbreviations; strftime('%b') follows the locale Qt sets at startup
+MONTH_ABBRS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def add_months(day: date, months: int) -> date:
+    """Shift the first-of-month date by whole months, rolling over year ends"""
+    year, month = divmod(day.month - 1 + months, 12)
+    return day.replace(year=day.year + year, month=month + 1)
+
+
 class LaunchDatabase:
     """Database operations for SHOCKWAVE PLANNER"""
     
@@ -23,6 +49,16 @@ class LaunchDatabase:
         self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets the timeline loader thread read while the GUI connection writes;
+        # NORMAL sync is safe under WAL and avoids an fsync on every commit
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        # Reference tables read on every editor/dialog open, cached until a write
+        self._sites_cache = {}
+        self._rockets_cache = None
+        self._statuses_cache = None
+        # Bumped on every re-entry site write so views can skip unchanged reloads
+        self.reentry_sites_version = 0
         self.init_database()
     
     def init_database(self):
@@ -217,6 +253,12 @@ class LaunchDatabase:
             )
         ''')
 
+        # Indexes for date-range filters and per-site/rocket/status chart queries
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_launches_date ON launches(launch_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_launches_status_date ON launches(status_id, launch_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_launches_site_date ON launches(site_id, launch_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_launches_rocket_date ON launches(rocket_id, launch_date)')
+
         # Initialize default statuses if empty
         cursor.execute("SELECT COUNT(*) FROM launch_status")
         if cursor.fetchone()[0] == 0:
@@ -333,6 +375,9 @@ class LaunchDatabase:
     
     def get_all_sites(self, site_type: str = 'LAUNCH') -> List[Dict]:
         """Get all launch/reentry sites"""
+        if site_type in self._sites_cache:
+            return [dict(site) for site in self._sites_cache[site_type]]
+        
         if site_type == 'REENTRY':
             cursor = self.conn.cursor()
             cursor.execute('''
@@ -349,7 +394,8 @@ class LaunchDatabase:
                 ORDER BY location, launch_pad
             ''')
         
-        return [dict(row) for row in cursor.fetchall()]
+        self._sites_cache[site_type] = [dict(row) for row in cursor.fetchall()]
+        return [dict(site) for site in self._sites_cache[site_type]]
     
     def add_site(self, site_data: Dict, site_type: str = 'LAUNCH') -> int:
         """Add a new launch or reentry site"""
@@ -369,6 +415,7 @@ class LaunchDatabase:
                 site_data.get('external_id'),
                 site_data.get('turnaround_days', 7)
             ))
+            self.reentry_sites_version += 1
         else:
             cursor.execute('''
                 INSERT INTO launch_sites (location, launch_pad, latitude, longitude, country, site_type, external_id, turnaround_days)
@@ -385,6 +432,7 @@ class LaunchDatabase:
             ))
         
         self.conn.commit()
+        self.invalidate_caches()
         return cursor.lastrowid
     
     def update_site(self, site_id: int, site_data: Dict):
@@ -409,6 +457,7 @@ class LaunchDatabase:
                 site_data.get('turnaround_days', 7),
                 site_id
             ))
+            self.reentry_sites_version += 1
         else:
             cursor.execute('''
                 UPDATE launch_sites SET
@@ -426,6 +475,7 @@ class LaunchDatabase:
             ))
         
         self.conn.commit()
+        self.invalidate_caches()
     
     def delete_site(self, site_id: int, site_type: str = 'LAUNCH'):
         """Delete a launch site or reentry site"""
@@ -433,10 +483,12 @@ class LaunchDatabase:
         
         if site_type == 'REENTRY':
             cursor.execute('DELETE FROM reentry_sites WHERE reentry_site_id = ?', (site_id,))
+            self.reentry_sites_version += 1
         else:
             cursor.execute('DELETE FROM launch_sites WHERE site_id = ?', (site_id,))
         
         self.conn.commit()
+        self.invalidate_caches()
     
     def calculate_pad_turnaround(self, site_id: int) -> Optional[int]:
         """
@@ -488,6 +540,7 @@ class LaunchDatabase:
                 WHERE site_id = ?
             ''', (turnaround, site_id))
             self.conn.commit()
+            self.invalidate_caches()
             return True
         
         return False
@@ -517,14 +570,16 @@ class LaunchDatabase:
     
     def get_all_rockets(self) -> List[Dict]:
         """Get all rockets"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT rocket_id, name, alternative_name, family, variant, manufacturer, country,
-                   stages, boosters, payload_leo, payload_sso, payload_gto, payload_tli
-            FROM rockets
-            ORDER BY name
-        ''')
-        return [dict(row) for row in cursor.fetchall()]
+        if self._rockets_cache is None:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT rocket_id, name, alternative_name, family, variant, manufacturer, country,
+                       stages, boosters, payload_leo, payload_sso, payload_gto, payload_tli
+                FROM rockets
+                ORDER BY name
+            ''')
+            self._rockets_cache = [dict(row) for row in cursor.fetchall()]
+        return [dict(rocket) for rocket in self._rockets_cache]
     
     def add_rocket(self, rocket_data: Dict) -> int:
         """Add a new rocket"""
@@ -553,6 +608,7 @@ class LaunchDatabase:
             rocket_data.get('external_id')
         ))
         self.conn.commit()
+        self.invalidate_caches()
         return cursor.lastrowid
     
     def update_rocket(self, rocket_id: int, rocket_data: Dict):
@@ -584,6 +640,7 @@ class LaunchDatabase:
             rocket_id
         ))
         self.conn.commit()
+        self.invalidate_caches()
     
     def update_rocket_preserve_manual(self, rocket_id: int, rocket_data: Dict):
         """Update rocket but preserve manually entered fields if API data is missing
@@ -640,12 +697,14 @@ class LaunchDatabase:
             rocket_id
         ))
         self.conn.commit()
+        self.invalidate_caches()
     
     def delete_rocket(self, rocket_id: int):
         """Delete a rocket"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM rockets WHERE rocket_id = ?', (rocket_id,))
         self.conn.commit()
+        self.invalidate_caches()
     
     def find_or_create_rocket(self, name: str, external_id: str = None) -> int:
         """Find existing rocket or create new one"""
@@ -737,13 +796,15 @@ class LaunchDatabase:
     
     def get_all_statuses(self) -> List[Dict]:
         """Get all launch statuses"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT status_id, status_name, status_abbr, status_color, description
-            FROM launch_status
-            ORDER BY status_id
-        ''')
-        return [dict(row) for row in cursor.fetchall()]
+        if self._statuses_cache is None:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT status_id, status_name, status_abbr, status_color, description
+                FROM launch_status
+                ORDER BY status_id
+            ''')
+            self._statuses_cache = [dict(row) for row in cursor.fetchall()]
+        return [dict(status) for status in self._statuses_cache]
     
     def find_status_by_name(self, name: str) -> Optional[int]:
         """Find status ID by name (case-insensitive)"""
@@ -876,33 +937,39 @@ class LaunchDatabase:
     def get_all_launches(self) -> List[Dict]:
         """Get all launches from database"""
         cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT l.*, 
-                   ls.location, ls.launch_pad, ls.country, ls.latitude, ls.longitude,
-                   r.name as rocket_name,
-                   st.status_name, st.status_color
-            FROM launches l
-            LEFT JOIN launch_sites ls ON l.site_id = ls.site_id
-            LEFT JOIN rockets r ON l.rocket_id = r.rocket_id
-            LEFT JOIN launch_status st ON l.status_id = st.status_id
+        cursor.execute(LAUNCH_SELECT + '''
             ORDER BY l.launch_date DESC, l.launch_time DESC
             LIMIT 1000
         ''')
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_launch_by_id(self, launch_id: int) -> Optional[Dict]:
+        """Get a single launch by ID, with its NOTAM serials joined as 'A|B|...' in notam_serials"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT launch.*, GROUP_CONCAT(ln.serial, '|') as notam_serials
+            FROM (''' + LAUNCH_SELECT + '''WHERE l.launch_id = ?) launch
+            LEFT JOIN launch_notam ln ON ln.launch_id = launch.launch_id
+            GROUP BY launch.launch_id
+        ''', (launch_id,))
+        
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def set_launch_notams(self, launch_id: int, serials: List[str]):
+        """Replace a launch's NOTAM links with the given serials in one transaction"""
+        with self.conn:
+            self.conn.execute('DELETE FROM launch_notam WHERE launch_id = ?', (launch_id,))
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO launch_notam (launch_id, serial) VALUES (?, ?)',
+                [(launch_id, serial) for serial in serials if serial]
+            )
+    
     def get_launches_by_month(self, year: int, month: int) -> List[Dict]:
         """Get all launches for a specific month"""
         cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT l.*, 
-                   ls.location, ls.launch_pad, ls.country, ls.latitude, ls.longitude,
-                   r.name as rocket_name,
-                   st.status_name, st.status_color
-            FROM launches l
-            LEFT JOIN launch_sites ls ON l.site_id = ls.site_id
-            LEFT JOIN rockets r ON l.rocket_id = r.rocket_id
-            LEFT JOIN launch_status st ON l.status_id = st.status_id
+        cursor.execute(LAUNCH_SELECT + '''
             WHERE strftime('%Y', l.launch_date) = ? AND strftime('%m', l.launch_date) = ?
             ORDER BY l.launch_date, l.launch_time
         ''', (str(year), f'{month:02d}'))
@@ -912,33 +979,58 @@ class LaunchDatabase:
     def get_launches_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
         """Get launches within a date range"""
         cursor = self.conn.cursor()
+        cursor.execute(LAUNCH_SELECT + '''
+            WHERE l.launch_date BETWEEN ? AND ?
+            ORDER BY l.launch_date, l.launch_time
+        ''', (start_date, end_date))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_launch_choices(self, start_date: str, end_date: str) -> List[Dict]:
+        """Get the id, date, mission and site of launches in a date range, for pickers"""
+        cursor = self.conn.cursor()
         cursor.execute('''
-            SELECT l.*, 
-                   ls.location, ls.launch_pad, ls.country, ls.latitude, ls.longitude,
-                   r.name as rocket_name,
-                   st.status_name, st.status_color
+            SELECT l.launch_id, l.launch_date, l.mission_name, ls.location
             FROM launches l
             LEFT JOIN launch_sites ls ON l.site_id = ls.site_id
-            LEFT JOIN rockets r ON l.rocket_id = r.rocket_id
-            LEFT JOIN launch_status st ON l.status_id = st.status_id
             WHERE l.launch_date BETWEEN ? AND ?
             ORDER BY l.launch_date, l.launch_time
         ''', (start_date, end_date))
         
         return [dict(row) for row in cursor.fetchall()]
     
-    def find_launch_by_external_id(self, external_id: str) -> Optional[Dict]:
-        """Find launch by external ID (e.g., Space Devs ID)"""
+    def iter_month_timeline(self, year: int, month: int) -> Iterator[Dict]:
+        """
+        Yield every launch site joined to its launches for a timeline month
+        
+        Launches from the previous month are included for turnaround carry-over.
+        Sites without launches in that window appear once with launch_id NULL.
+        Rows are ordered by country, site and launch date and streamed from the
+        cursor rather than collected into a list.
+        """
+        start = add_months(date(year, month, 1), -1)
+        end = add_months(date(year, month, 1), 1)
         cursor = self.conn.cursor()
         cursor.execute('''
-            SELECT l.*, 
-                   ls.location, ls.launch_pad, ls.country, ls.latitude, ls.longitude,
-                   r.name as rocket_name,
-                   st.status_name, st.status_color
-            FROM launches l
-            LEFT JOIN launch_sites ls ON l.site_id = ls.site_id
+            SELECT COALESCE(NULLIF(ls.country, ''), 'Other') as country,
+                   ls.site_id, ls.location, ls.launch_pad, ls.turnaround_days,
+                   l.launch_id, l.launch_date, r.name as rocket_name, st.status_color
+            FROM launch_sites ls
+            LEFT JOIN launches l ON l.site_id = ls.site_id
+                AND l.launch_date >= ? AND l.launch_date < ?
             LEFT JOIN rockets r ON l.rocket_id = r.rocket_id
             LEFT JOIN launch_status st ON l.status_id = st.status_id
+            ORDER BY country, ls.location, ls.launch_pad, ls.site_id,
+                     l.launch_date, l.launch_time
+        ''', (start.isoformat(), end.isoformat()))
+        
+        for row in cursor:
+            yield dict(row)
+    
+    def find_launch_by_external_id(self, external_id: str) -> Optional[Dict]:
+        """Find launch by external ID (e.g., Space Devs ID)"""
+        cursor = self.conn.cursor()
+        cursor.execute(LAUNCH_SELECT + '''
             WHERE l.external_id = ?
         ''', (external_id,))
         
@@ -1007,34 +1099,28 @@ class LaunchDatabase:
         """Get launch statistics by year for the past N years"""
         cursor = self.conn.cursor()
         
-        stats_by_year = []
         current_year = datetime.now().year
+        first_year = current_year - years + 1
         
-        for year in range(current_year - years + 1, current_year + 1):
-            # Total launches for the year
-            cursor.execute('''
-                SELECT COUNT(*) FROM launches 
-                WHERE strftime('%Y', launch_date) = ?
-            ''', (str(year),))
-            total = cursor.fetchone()[0]
-            
-            # Successful launches (status_name = 'Success')
-            cursor.execute('''
-                SELECT COUNT(*) FROM launches l
-                LEFT JOIN launch_status s ON l.status_id = s.status_id
-                WHERE strftime('%Y', l.launch_date) = ? 
-                AND s.status_name = 'Success'
-            ''', (str(year),))
-            successful = cursor.fetchone()[0]
-            
-            # Failed launches (status_name = 'Failure' or 'Partial Failure')
-            cursor.execute('''
-                SELECT COUNT(*) FROM launches l
-                LEFT JOIN launch_status s ON l.status_id = s.status_id
-                WHERE strftime('%Y', l.launch_date) = ? 
-                AND (s.status_name = 'Failure' OR s.status_name = 'Partial Failure')
-            ''', (str(year),))
-            failed = cursor.fetchone()[0]
+        # One conditional-aggregate pass over the whole range
+        cursor.execute('''
+            SELECT CAST(strftime('%Y', l.launch_date) AS INTEGER) AS year,
+                   COUNT(*) AS total,
+                   SUM(CASE WHEN s.status_name = 'Success' THEN 1 ELSE 0 END) AS successful,
+                   SUM(CASE WHEN s.status_name IN ('Failure', 'Partial Failure')
+                            THEN 1 ELSE 0 END) AS failed
+            FROM launches l
+            LEFT JOIN launch_status s ON l.status_id = s.status_id
+            WHERE l.launch_date >= ? AND l.launch_date < ?
+            GROUP BY year
+        ''', (f"{first_year}-01-01", f"{current_year + 1}-01-01"))
+        counts = {row['year']: (row['total'], row['successful'], row['failed'])
+                  for row in cursor.fetchall()}
+        
+        stats_by_year = []
+        for year in range(first_year, current_year + 1):
+            # Years with no launches are absent from the result set
+            total, successful, failed = counts.get(year, (0, 0, 0))
             
             # Pending launches (everything else)
             pending = total - successful - failed
@@ -1073,36 +1159,52 @@ class LaunchDatabase:
         countries = [row[0] for row in cursor.fetchall()]
         return countries
     
-    def get_launch_sites_by_country(self, country: str = None) -> List[str]:
-        """Get launch sites, optionally filtered by country"""
+    def get_launch_sites_by_country(self, country: str = None) -> List[Dict]:
+        """
+        Get launch sites, optionally filtered by country
+        
+        Returns:
+            list of dicts with 'location', 'country' and 'site_ids' (tuple of
+            the pad site_ids at that location, used as the integer chart filter key)
+        """
         cursor = self.conn.cursor()
         
         if country:
             cursor.execute('''
-                SELECT DISTINCT ls.location
+                SELECT ls.location, ls.country, GROUP_CONCAT(DISTINCT ls.site_id) AS site_ids
                 FROM launch_sites ls
                 INNER JOIN launches l ON ls.site_id = l.site_id
                 WHERE ls.country = ?
+                GROUP BY ls.location, ls.country
                 ORDER BY ls.location
             ''', (country,))
         else:
             cursor.execute('''
-                SELECT DISTINCT ls.location
+                SELECT ls.location, ls.country, GROUP_CONCAT(DISTINCT ls.site_id) AS site_ids
                 FROM launch_sites ls
                 INNER JOIN launches l ON ls.site_id = l.site_id
+                GROUP BY ls.location, ls.country
                 ORDER BY ls.location
             ''')
         
-        sites = [row[0] for row in cursor.fetchall()]
+        sites = [{'location': row[0],
+                  'country': row[1],
+                  'site_ids': tuple(sorted(int(s) for s in row[2].split(',')))}
+                 for row in cursor.fetchall()]
         return sites
     
-    def get_rockets_by_country(self, country: str = None) -> List[str]:
-        """Get rockets, optionally filtered by country"""
+    def get_rockets_by_country(self, country: str = None) -> List[Dict]:
+        """
+        Get rockets, optionally filtered by country
+        
+        Returns:
+            list of dicts with 'rocket_id', 'name' and 'country'
+        """
         cursor = self.conn.cursor()
         
         if country:
             cursor.execute('''
-                SELECT DISTINCT r.name
+                SELECT DISTINCT r.rocket_id, r.name, r.country
                 FROM rockets r
                 INNER JOIN launches l ON r.rocket_id = l.rocket_id
                 WHERE r.country = ?
@@ -1110,75 +1212,151 @@ class LaunchDatabase:
             ''', (country,))
         else:
             cursor.execute('''
-                SELECT DISTINCT r.name
+                SELECT DISTINCT r.rocket_id, r.name, r.country
                 FROM rockets r
                 INNER JOIN launches l ON r.rocket_id = l.rocket_id
                 ORDER BY r.name
             ''')
         
-        rockets = [row[0] for row in cursor.fetchall()]
+        rockets = [dict(row) for row in cursor.fetchall()]
         return rockets
     
+    def _chart_filters(self, country: str = None, site_ids: Tuple[int, ...] = None,
+                       rocket_id: int = None) -> Tuple[List[str], List[str], List]:
+        """
+        Build the joins, conditions and params shared by the chart queries
+        
+        Site and rocket filters compare the integer foreign keys on launches
+        directly, so only the country filter needs to join launch_sites.
+        """
+        joins = []
+        conditions = []
+        params = []
+        
+        if country:
+            joins.append("INNER JOIN launch_sites ls ON l.site_id = ls.site_id")
+            conditions.append("ls.country = ?")
+            params.append(country)
+        
+        if site_ids:
+            conditions.append(f"l.site_id IN ({', '.join('?' * len(site_ids))})")
+            params.extend(site_ids)
+        
+        if rocket_id is not None:
+            conditions.append("l.rocket_id = ?")
+            params.append(rocket_id)
+        
+        return joins, conditions, params
+    
+    def _daily_counts(self, windows: List[Tuple[date, date]], joins: List[str],
+                      conditions: List[str], params: List) -> List[List[int]]:
+        """
+        Count launches per calendar day for one or more inclusive date windows
+        
+        All windows are fetched in a single query grouped by the launch day's
+        integer offset from the earliest window start; each offset is then
+        scattered into its window's zero-filled list without parsing dates.
+        """
+        cursor = self.conn.cursor()
+        
+        base_date = min(start_date for start_date, _ in windows)
+        base_str = base_date.isoformat()
+        
+        window_conditions = []
+        window_params = []
+        for start_date, end_date in windows:
+            window_conditions.append("(l.launch_date >= ? AND l.launch_date < ?)")
+            window_params.extend([start_date.isoformat(),
+                                  (end_date + timedelta(days=1)).isoformat()])
+        
+        query = '''
+            SELECT CAST(julianday(date(l.launch_date)) - julianday(?) AS INTEGER) as day_offset,
+                   COUNT(*) as count
+            FROM launches l
+        '''
+        if joins:
+            query += " " + " ".join(joins)
+        query += " WHERE " + " AND ".join(["(" + " OR ".join(window_conditions) + ")"] + conditions)
+        query += " GROUP BY day_offset"
+        
+        cursor.execute(query, [base_str] + window_params + params)
+        
+        # Window bounds as offsets from base_date
+        bounds = [((start_date - base_date).days, (end_date - base_date).days)
+                  for start_date, end_date in windows]
+        counts = [[0] * (last - first + 1) for first, last in bounds]
+        for day_offset, count in cursor.fetchall():
+            for window_counts, (first, last) in zip(counts, bounds):
+                if first <= day_offset <= last:
+                    window_counts[day_offset - first] = count
+        return counts
+    
     def get_launch_data_monthly(self, year: int, country: str = None, 
-                                site: str = None, rocket: str = None) -> Tuple[List[int], List[int]]:
+                                site_ids: Tuple[int, ...] = None,
+                                rocket_id: int = None) -> Tuple[List[int], List[int]]:
         """
         Get monthly launch counts for a specific year with optional filters
         
         Args:
             year: Year to get data for
             country: Optional country filter
-            site: Optional launch site filter
-            rocket: Optional rocket filter
+            site_ids: Optional launch site filter (site_ids of one location)
+            rocket_id: Optional rocket filter
         
         Returns:
             tuple: (months list, counts list) where months are 1-12
         """
+        counts = self.get_launch_data_monthly_by_year([year], country, site_ids, rocket_id)
+        return list(range(1, 13)), counts[year]
+    
+    def get_launch_data_monthly_by_year(self, years: List[int], country: str = None,
+                                        site_ids: Tuple[int, ...] = None,
+                                        rocket_id: int = None) -> Dict[int, List[int]]:
+        """
+        Get monthly launch counts for several years in one query
+        
+        Args:
+            years: Years to get data for
+            country: Optional country filter
+            site_ids: Optional launch site filter (site_ids of one location)
+            rocket_id: Optional rocket filter
+        
+        Returns:
+            dict: year -> list of 12 monthly counts (Jan-Dec)
+        """
         cursor = self.conn.cursor()
         
         # Build query dynamically based on filters
         query = '''
-            SELECT strftime('%m', l.launch_date) as month, COUNT(*) as count
+            SELECT strftime('%Y-%m', l.launch_date) as year_month, COUNT(*) as count
             FROM launches l
         '''
         
-        joins = []
-        conditions = ["strftime('%Y', l.launch_date) = ?"]
-        params = [str(year)]
-        
-        # Add joins and conditions based on filters
-        if country or site:
-            joins.append("INNER JOIN launch_sites ls ON l.site_id = ls.site_id")
-            if country:
-                conditions.append("ls.country = ?")
-                params.append(country)
-            if site:
-                conditions.append("ls.location = ?")
-                params.append(site)
-        
-        if rocket:
-            joins.append("INNER JOIN rockets r ON l.rocket_id = r.rocket_id")
-            conditions.append("r.name = ?")
-            params.append(rocket)
+        # One index-friendly date range per year, grouped on a single expression
+        joins, conditions, params = self._chart_filters(country, site_ids, rocket_id)
+        conditions.insert(0, "(" + " OR ".join(
+            ["(l.launch_date >= ? AND l.launch_date < ?)"] * len(years)) + ")")
+        params[:0] = [bound for year in years
+                      for bound in (f"{year}-01-01", f"{year + 1}-01-01")]
         
         # Combine query parts
         if joins:
             query += " " + " ".join(joins)
         query += " WHERE " + " AND ".join(conditions)
-        query += " GROUP BY month ORDER BY month"
+        query += " GROUP BY year_month"
         
         cursor.execute(query, params)
-        results = cursor.fetchall()
         
-        # Create full 12-month data (fill missing months with 0)
-        month_counts = {int(row[0]): row[1] for row in results}
-        months = list(range(1, 13))
-        counts = [month_counts.get(m, 0) for m in months]
+        # Create full 12-month data per year (fill missing months with 0)
+        counts = {year: [0] * 12 for year in years}
+        for year_month, count in cursor.fetchall():
+            counts[int(year_month[:4])][int(year_month[5:7]) - 1] = count
         
-        return months, counts
+        return counts
     
     def get_launch_data_daily(self, year: int, num_months: int, 
-                              country: str = None, site: str = None, 
-                              rocket: str = None) -> Tuple[List[str], List[int]]:
+                              country: str = None, site_ids: Tuple[int, ...] = None, 
+                              rocket_id: int = None) -> Tuple[List[str], List[int]]:
         """
         Get daily launch counts for specified number of months from current date
         
@@ -1186,84 +1364,37 @@ class LaunchDatabase:
             year: Year to get data for
             num_months: Number of months to include
             country: Optional country filter
-            site: Optional launch site filter
-            rocket: Optional rocket filter
+            site_ids: Optional launch site filter (site_ids of one location)
+            rocket_id: Optional rocket filter
         
         Returns:
             tuple: (dates list, counts list)
         """
-        from datetime import timedelta
-        cursor = self.conn.cursor()
-        
         # Calculate date range (ending at current date in the specified year)
-        current_date = datetime.now()
-        if year == current_date.year:
-            end_date = current_date
+        today = date.today()
+        if year == today.year:
+            end_date = today
         else:
             # For past years, use end of year
-            end_date = datetime(year, 12, 31)
+            end_date = date(year, 12, 31)
         
         start_date = end_date - timedelta(days=num_months * 30)
         
-        # Build query dynamically
-        query = '''
-            SELECT l.launch_date, COUNT(*) as count
-            FROM launches l
-        '''
-        
-        joins = []
-        conditions = [
-            "l.launch_date >= ?",
-            "l.launch_date <= ?",
-            "strftime('%Y', l.launch_date) = ?"
-        ]
-        params = [
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d'),
-            str(year)
-        ]
-        
-        # Add joins and conditions based on filters
-        if country or site:
-            joins.append("INNER JOIN launch_sites ls ON l.site_id = ls.site_id")
-            if country:
-                conditions.append("ls.country = ?")
-                params.append(country)
-            if site:
-                conditions.append("ls.location = ?")
-                params.append(site)
-        
-        if rocket:
-            joins.append("INNER JOIN rockets r ON l.rocket_id = r.rocket_id")
-            conditions.append("r.name = ?")
-            params.append(rocket)
-        
-        # Combine query parts
-        if joins:
-            query += " " + " ".join(joins)
-        query += " WHERE " + " AND ".join(conditions)
-        query += " GROUP BY l.launch_date ORDER BY l.launch_date"
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
+        # Launches outside the requested year are excluded with a plain range
+        joins, conditions, params = self._chart_filters(country, site_ids, rocket_id)
+        conditions[:0] = ["l.launch_date >= ?", "l.launch_date < ?"]
+        params[:0] = [f"{year}-01-01", f"{year + 1}-01-01"]
         
-        # Create continuous date range with all days
-        date_counts = {row[0]: row[1] for row in results}
+        counts = self._daily_counts([(start_date, end_date)], joins, conditions, params)[0]
         
-        dates = []
-        counts = []
-        current = start_date
-        while current <= end_date:
-            date_str = current.strftime('%Y-%m-%d')
-            dates.append(current.strftime('%m-%d'))  # Format as MM-DD for display
-            counts.append(date_counts.get(date_str, 0))
-            current += timedelta(days=1)
+        # Format as MM-DD for display
+        dates = [(start_date + timedelta(days=i)).strftime('%m-%d') for i in range(len(counts))]
         
         return dates, counts
     
     def get_launch_data_daily_by_month(self, year: int, start_month: int, num_months: int,
-                                        country: str = None, site: str = None, 
-                                        rocket: str = None) -> Tuple[List[str], List[int], str]:
+                                        country: str = None, site_ids: Tuple[int, ...] = None, 
+                                        rocket_id: int = None) -> Tuple[List[str], List[int], str]:
         """
         Get daily launch counts for specified month range
         
@@ -1272,91 +1403,62 @@ class LaunchDatabase:
             start_month: Starting month (1-12)
             num_months: Number of months to include (1 or 3)
             country: Optional country filter
-            site: Optional launch site filter
-            rocket: Optional rocket filter
+            site_ids: Optional launch site filter (site_ids of one location)
+            rocket_id: Optional rocket filter
         
         Returns:
             tuple: (dates list as day numbers, counts list, date_range_string)
         """
-        from datetime import timedelta
-        import calendar
-        cursor = self.conn.cursor()
-        
-        # Calculate date range based on selected month and number of months
-        start_date = datetime(year, start_month, 1)
-        
-        # Calculate end date
-        end_month = start_month + num_months - 1
-        end_year = year
-        if end_month > 12:
-            end_month = end_month - 12
-            end_year = year + 1
-        
-        # Get last day of the end month
-        last_day = calendar.monthrange(end_year, end_month)[1]
-        end_date = datetime(end_year, end_month, last_day)
-        
-        # Build query dynamically
-        query = '''
-            SELECT l.launch_date, COUNT(*) as count
-            FROM launches l
-        '''
-        
-        joins = []
-        conditions = [
-            "l.launch_date >= ?",
-            "l.launch_date <= ?"
-        ]
-        params = [
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        ]
-        
-        # Add joins and conditions based on filters
-        if country or site:
-            joins.append("INNER JOIN launch_sites ls ON l.site_id = ls.site_id")
-            if country:
-                conditions.append("ls.country = ?")
-                params.append(country)
-            if site:
-                conditions.append("ls.location = ?")
-                params.append(site)
-        
-        if rocket:
-            joins.append("INNER JOIN rockets r ON l.rocket_id = r.rocket_id")
-            conditions.append("r.name = ?")
-            params.append(rocket)
+        return self.get_launch_data_daily_by_month_by_year(
+            [year], start_month, num_months, country, site_ids, rocket_id
+        )[year]
+    
+    def get_launch_data_daily_by_month_by_year(self, years: List[int], start_month: int,
+                                               num_months: int, country: str = None,
+                                               site_ids: Tuple[int, ...] = None,
+                                               rocket_id: int = None) -> Dict[int, Tuple[List[str], List[int], str]]:
+        """
+        Get daily launch counts for the same month range in several years in one query
         
-        # Combine query parts
-        if joins:
-            query += " " + " ".join(joins)
-        query += " WHERE " + " AND ".join(conditions)
-        query += " GROUP BY l.launch_date ORDER BY l.launch_date"
+        Args:
+            years: Years to get data for
+            start_month: Starting month (1-12)
+            num_months: Number of months to include (1 or 3)
+            country: Optional country filter
+            site_ids: Optional launch site filter (site_ids of one location)
+            rocket_id: Optional rocket filter
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        
-        # Create continuous date range with all days
-        date_counts = {row[0]: row[1] for row in results}
-        
-        dates = []
-        counts = []
-        current = start_date
-        while current <= end_date:
-            date_str = current.strftime('%Y-%m-%d')
-            dates.append(str(current.day))  # Just the day number
-            counts.append(date_counts.get(date_str, 0))
-            current += timedelta(days=1)
-        
-        # Create date range string for display
-        month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        if num_months == 1:
-            date_range = f"{month_names[start_month-1]} {year}"
-        else:
-            date_range = f"{month_names[start_month-1]} - {month_names[end_month-1]} {year}"
+        Returns:
+            dict: year -> (dates list as day numbers, counts list, date_range_string)
+        """
+        windows = []
+        window_dates = []
+        for year in years:
+            # Month starts spanning the window, plus the first day after it
+            month_starts = [add_months(date(year, start_month, 1), offset)
+                            for offset in range(num_months + 1)]
+            windows.append((month_starts[0], month_starts[-1] - timedelta(days=1)))
+            
+            # Day-number labels, one month-length slice at a time
+            dates = []
+            for month_start, next_start in zip(month_starts, month_starts[1:]):
+                dates += DAY_LABELS[:(next_start - month_start).days]
+            window_dates.append(dates)
+        
+        joins, conditions, params = self._chart_filters(country, site_ids, rocket_id)
+        window_counts = self._daily_counts(windows, joins, conditions, params)
+        
+        results = {}
+        for year, (start_date, end_date), dates, counts in zip(years, windows, window_dates, window_counts):
+            # Create date range string for display
+            if num_months == 1:
+                date_range = f"{MONTH_ABBRS[start_date.month - 1]} {year}"
+            else:
+                date_range = f"{MONTH_ABBRS[start_date.month - 1]} - {MONTH_ABBRS[end_date.month - 1]} {year}"
+            
+            results[year] = (dates, counts, date_range)
         
-        return dates, counts, date_range
+        return results
     
     # ==================== RE-ENTRY OPERATIONS (NEW in v2.0) ====================
     
@@ -1379,6 +1481,8 @@ class LaunchDatabase:
             site_data.get('turnaround_days', 7)
         ))
         self.conn.commit()
+        self.invalidate_caches()
+        self.reentry_sites_version += 1
         return cursor.lastrowid
     
     def add_reentry(self, reentry_data: Dict) -> int:
@@ -1423,6 +1527,26 @@ class LaunchDatabase:
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_reentry_timeline(self, year: int, month: int) -> List[Dict]:
+        """
+        Get the re-entries shown on a timeline month, plus the previous month's for
+        turnaround carry-over, in one range query with only the columns the timeline uses
+        """
+        start = add_months(date(year, month, 1), -1)
+        end = add_months(date(year, month, 1), 1)
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT re.reentry_id, re.reentry_date, re.vehicle_component,
+                   rs.location, rs.drop_zone, st.status_color
+            FROM reentries re
+            LEFT JOIN reentry_sites rs ON re.reentry_site_id = rs.reentry_site_id
+            LEFT JOIN launch_status st ON re.status_id = st.status_id
+            WHERE re.reentry_date >= ? AND re.reentry_date < ?
+            ORDER BY re.reentry_date, re.reentry_time
+        ''', (start.isoformat(), end.isoformat()))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
     def get_all_reentry_sites(self) -> List[Dict]:
         """Get all re-entry sites from reentry_sites table"""
         cursor = self.conn.cursor()
@@ -1442,6 +1566,44 @@ class LaunchDatabase:
         ''')
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_reentry_site(self, site_id: int) -> Optional[Dict]:
+        """Get the editable fields of a single re-entry site"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT reentry_site_id as site_id, location, drop_zone, country,
+                   turnaround_days, latitude, longitude, zone_type
+            FROM reentry_sites
+            WHERE reentry_site_id = ?
+        ''', (site_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def iter_drop_zone_rows(self, chunk_size: int = 200) -> Iterator[List[Tuple]]:
+        """
+        Yield re-entry sites for the drop zones table in chunks of plain tuples:
+        (site_id, then the display strings for ID, location, drop zone, country,
+        turnaround days, latitude and longitude), formatted by SQLite
+        
+        One query is streamed with fetchmany, so only the chunks asked for are read.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute('''
+            SELECT reentry_site_id,
+                   CAST(reentry_site_id AS TEXT),
+                   IFNULL(location, ''), IFNULL(drop_zone, ''), IFNULL(country, ''),
+                   IFNULL(CAST(turnaround_days AS TEXT), ''),
+                   CASE WHEN latitude THEN printf('%.4f°', latitude) ELSE '' END,
+                   CASE WHEN longitude THEN printf('%.4f°', longitude) ELSE '' END
+            FROM reentry_sites
+            ORDER BY country, location, drop_zone, reentry_site_id
+        ''')
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    
     def update_reentry_site(self, site_id: int, site_data: Dict):
         """Update an existing re-entry site"""
         cursor = self.conn.cursor()
@@ -1466,12 +1628,16 @@ class LaunchDatabase:
             site_id
         ))
         self.conn.commit()
+        self.invalidate_caches()
+        self.reentry_sites_version += 1
     
     def delete_reentry_site(self, site_id: int):
         """Delete a re-entry site"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM reentry_sites WHERE reentry_site_id = ?', (site_id,))
         self.conn.commit()
+        self.invalidate_caches()
+        self.reentry_sites_version += 1
     
     def update_reentry(self, reentry_id: int, reentry_data: Dict):
         """Update an existing re-entry record"""
@@ -1522,6 +1688,24 @@ class LaunchDatabase:
         ''')
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_reentry_by_id(self, reentry_id: int) -> Optional[Dict]:
+        """Get a single re-entry by ID"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT re.*, 
+                   rs.location, rs.drop_zone,
+                   l.mission_name, l.payload_name,
+                   st.status_name, st.status_color
+            FROM reentries re
+            LEFT JOIN reentry_sites rs ON re.reentry_site_id = rs.reentry_site_id
+            LEFT JOIN launches l ON re.launch_id = l.launch_id
+            LEFT JOIN launch_status st ON re.status_id = st.status_id
+            WHERE re.reentry_id = ?
+        ''', (reentry_id,))
+        
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
     # ==================== SYNC OPERATIONS (NEW in v2.0) ====================
     
     def log_sync(self, data_source: str, records_added: int, records_updated: int, 
@@ -1549,6 +1733,16 @@ class LaunchDatabase:
     
     # ==================== UTILITY ====================
     
+    def q(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a one-off query on the shared connection (statements are cached by sqlite3)"""
+        return self.conn.execute(sql, params)
+    
+    def invalidate_caches(self):
+        """Drop cached sites/rockets/statuses, e.g. after writes made outside this class"""
+        self._sites_cache = {}
+        self._rockets_cache = None
+        self._statuses_cache = None
+    
     def close(self):
         """Close database connection"""
         self.conn.close()
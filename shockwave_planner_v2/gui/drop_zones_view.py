@@ -6,18 +6,104 @@ Author: Remix Astronautics
 Date: December 2025
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                              QTableWidget, QTableWidgetItem, QHeaderView,
+                              QTableView, QHeaderView,
                               QMessageBox, QDialog, QFormLayout, QLineEdit,
                               QDialogButtonBox, QDoubleSpinBox, QComboBox, QSpinBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+
+
+_ZONE_HEADERS = ('ID', 'Location', 'Drop Zone', 'Country', 'Recovery (days)', 'Latitude', 'Longitude')
+
+
+class DropZonesModel(QAbstractTableModel):
+    """
+    Read-only table model over re-entry drop zones
+    
+    Zones are streamed a page at a time from iter_pages(page_size)
+    (LaunchDatabase.iter_drop_zone_rows); the view asks for the next page via
+    canFetchMore/fetchMore as the user scrolls. Zones arrive with their display
+    strings already formatted by SQLite, so data() is a plain tuple lookup.
+    """
+    
+    PAGE_SIZE = 200
+    
+    def __init__(self, iter_pages, parent=None):
+        super().__init__(parent)
+        self._iter_pages = iter_pages
+        self._pages = iter(())
+        self._rows = []
+        self._zone_ids = []
+        self._exhausted = True
+    
+    def reload(self):
+        """Drop loaded zones and fetch the first page with a single model reset"""
+        self.beginResetModel()
+        self._rows = []
+        self._zone_ids = []
+        self._pages = self._iter_pages(self.PAGE_SIZE)
+        self._append(next(self._pages, []))
+        self.endResetModel()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        zones = next(self._pages, [])
+        if zones:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(zones) - 1)
+            self._append(zones)
+            self.endInsertRows()
+        else:
+            self._exhausted = True
+    
+    def _append(self, zones):
+        self._exhausted = len(zones) < self.PAGE_SIZE
+        self._zone_ids.extend(zone[0] for zone in zones)
+        self._rows.extend(zone[1:] for zone in zones)
+    
+    def remove_row(self, row):
+        """Remove a single zone row (e.g. after deleting it) without reloading"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._zone_ids[row]
+        self.endRemoveRows()
+    
+    def row_text(self, row, column):
+        return self._rows[row][column]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_ZONE_HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            # Typed zone id on every cell of the row
+            return self._zone_ids[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _ZONE_HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class DropZonesView(QWidget):
     """Management view for re-entry drop zones"""
     
+    zones_changed = pyqtSignal()  # Emitted after a zone is added, edited or deleted
+    
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
+        self._loaded_version = None  # db.reentry_sites_version the table was loaded at
         self.init_ui()
     
     def init_ui(self):
@@ -42,82 +128,71 @@ class DropZonesView(QWidget):
         button_layout.addStretch()
         
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.refresh_table)
+        refresh_btn.clicked.connect(lambda: self.refresh_table(force=True))
         button_layout.addWidget(refresh_btn)
         
         layout.addLayout(button_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            'ID', 'Location', 'Drop Zone', 'Country', 'Recovery (days)', 'Latitude', 'Longitude'
-        ])
+        self.model = DropZonesModel(self.db.iter_drop_zone_rows, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.doubleClicked.connect(self.edit_zone)
         
         layout.addWidget(self.table)
         
         self.setLayout(layout)
-        self.refresh_table()
-    
-    def refresh_table(self):
-        """Refresh the zones table"""
-        # FIXED: Use get_all_reentry_sites() instead of get_all_sites()
-        zones = self.db.get_all_reentry_sites()
         
-        self.table.setRowCount(len(zones))
+        # Load after the window has painted rather than during construction
+        QTimer.singleShot(0, self.refresh_table)
+    
+    def refresh_table(self, force=False):
+        """Refresh the zones table, skipping the query if no zone was written since"""
+        if not force and self._loaded_version == self.db.reentry_sites_version:
+            return
+        self._loaded_version = self.db.reentry_sites_version
         
-        for row, zone in enumerate(zones):
-            self.table.setItem(row, 0, QTableWidgetItem(str(zone.get('site_id', ''))))
-            self.table.setItem(row, 1, QTableWidgetItem(zone.get('location', '')))
-            self.table.setItem(row, 2, QTableWidgetItem(zone.get('drop_zone', '')))
-            self.table.setItem(row, 3, QTableWidgetItem(zone.get('country', '')))
-            
-            # Recovery time
-            turnaround = zone.get('turnaround_days', 7)
-            self.table.setItem(row, 4, QTableWidgetItem(str(turnaround)))
-            
-            lat = zone.get('latitude')
-            self.table.setItem(row, 5, QTableWidgetItem(f"{lat:.4f}°" if lat else ''))
-            
-            lon = zone.get('longitude')
-            self.table.setItem(row, 6, QTableWidgetItem(f"{lon:.4f}°" if lon else ''))
+        # One model reset; keep the view from repainting or re-sorting mid-reload
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        try:
+            self.model.reload()
+        finally:
+            self.table.setUpdatesEnabled(True)
     
     def add_zone(self):
         """Add a new drop zone"""
         dialog = ZoneEditorDialog(self.db, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.refresh_table()
-            if self.window():
-                self.window().refresh_all()
+            self.zones_changed.emit()
     
     def edit_zone(self):
         """Edit the selected zone"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        current = self.table.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a drop zone to edit.")
             return
         
-        zone_id = int(self.table.item(current_row, 0).text())
+        zone_id = current.data(Qt.ItemDataRole.UserRole)
         dialog = ZoneEditorDialog(self.db, zone_id=zone_id, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.refresh_table()
-            if self.window():
-                self.window().refresh_all()
+            self.zones_changed.emit()
     
     def delete_zone(self):
         """Delete the selected zone"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        current = self.table.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a drop zone to delete.")
             return
         
-        zone_id = int(self.table.item(current_row, 0).text())
-        location = self.table.item(current_row, 1).text()
-        zone = self.table.item(current_row, 2).text()
+        zone_id = current.data(Qt.ItemDataRole.UserRole)
+        location = self.model.row_text(current.row(), 1)
+        zone = self.model.row_text(current.row(), 2)
         
         reply = QMessageBox.question(
             self,
@@ -131,9 +206,10 @@ class DropZonesView(QWidget):
             try:
                 # FIXED: Use delete_reentry_site() instead of delete_site()
                 self.db.delete_reentry_site(zone_id)
-                self.refresh_table()
-                if self.window():
-                    self.window().refresh_all()
+                # Drop just this row; the table now matches the database again
+                self.model.remove_row(current.row())
+                self._loaded_version = self.db.reentry_sites_version
+                self.zones_changed.emit()
                 QMessageBox.information(self, "Success", "Drop zone deleted successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete drop zone: {e}")
@@ -214,9 +290,7 @@ class ZoneEditorDialog(QDialog):
     
     def load_zone_data(self):
         """Load existing zone data"""
-        # FIXED: Use get_all_reentry_sites() instead of get_all_sites()
-        zones = self.db.get_all_reentry_sites()
-        zone = next((z for z in zones if z['site_id'] == self.zone_id), None)
+        zone = self.db.get_reentry_site(self.zone_id)
         
         if zone:
             self.location_edit.setText(zone.get('location', ''))
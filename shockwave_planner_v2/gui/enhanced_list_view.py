@@ -214,15 +214,10 @@ class EnhancedListView(QWidget):
             self.launch_table.setItem(row, 7, create_centered_item(launch.get('orbit_type', '')))
             
             # NOTAM
-            notam_data = self.db.conn.cursor().execute("""
-                                                        SELECT group_concat(ln.serial, ', ') AS tooltip 
-                                                        FROM launch_notam AS ln 
-                                                        WHERE ln.launch_id == ?;
-                                                       """, 
-                                                       (str(launch['launch_id']),)
-                                                       )
-            notam_data = [dict(row) for row in notam_data.fetchall()]
-            notam_tooltip = notam_data[0]['tooltip']
+            notam_tooltip = self.db.q(
+                "SELECT group_concat(serial, ', ') FROM launch_notam WHERE launch_id = ?",
+                (launch['launch_id'],)
+            ).fetchone()[0]
             
             notam_item = create_centered_item(notam_tooltip)
             if notam_tooltip:
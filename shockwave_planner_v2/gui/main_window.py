@@ -11,9 +11,8 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QDialog, QFormLayout, QDialogButtonBox, QLineEdit,
                               QComboBox, QDateEdit, QTimeEdit, QTextEdit,
                               QMessageBox, QProgressDialog, QTableWidget, QTableWidgetItem)
-from PyQt6.QtCore import Qt, QDate, QTime, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QDate, QTime, QThread, QSignalBlocker, pyqtSignal
 from PyQt6.QtGui import QAction, QFont
-from datetime import datetime
 import sys
 import os
 
@@ -68,6 +67,15 @@ class SyncWorker(QThread):
             self.finished.emit({'added': 0, 'updated': 0, 'errors': [str(e)]})
 
 
+def _fill_combo(combo, items):
+    """Load (label, data) pairs into a combo with one bulk insert and no per-item signals"""
+    with QSignalBlocker(combo):
+        combo.clear()
+        combo.addItems([label for label, _ in items])
+        for index, (_, data) in enumerate(items):
+            combo.setItemData(index, data)
+
+
 class LaunchEditorDialog(QDialog):
     """Dialog for adding/editing launch records"""
     
@@ -99,9 +107,8 @@ class LaunchEditorDialog(QDialog):
         # Launch Site
         self.site_combo = QComboBox()
         self.site_combo.setEditable(True)
-        sites = self.db.get_all_sites()
-        for site in sites:
-            self.site_combo.addItem(f"{site['location']} - {site['launch_pad']}", site['site_id'])
+        _fill_combo(self.site_combo, [(f"{site['location']} - {site['launch_pad']}", site['site_id'])
+                                      for site in self.db.get_all_sites()])
         layout.addRow("Launch Site:", self.site_combo)
         
         # Add Site button
@@ -112,9 +119,8 @@ class LaunchEditorDialog(QDialog):
         # Rocket
         self.rocket_combo = QComboBox()
         self.rocket_combo.setEditable(True)
-        rockets = self.db.get_all_rockets()
-        for rocket in rockets:
-            self.rocket_combo.addItem(rocket['name'], rocket['rocket_id'])
+        _fill_combo(self.rocket_combo, [(rocket['name'], rocket['rocket_id'])
+                                        for rocket in self.db.get_all_rockets()])
         layout.addRow("Rocket:", self.rocket_combo)
         
         # Add Rocket button
@@ -153,9 +159,8 @@ class LaunchEditorDialog(QDialog):
 
         # Status
         self.status_combo = QComboBox()
-        statuses = self.db.get_all_statuses()
-        for status in statuses:
-            self.status_combo.addItem(status['status_name'], status['status_id'])
+        _fill_combo(self.status_combo, [(status['status_name'], status['status_id'])
+                                        for status in self.db.get_all_statuses()])
         layout.addRow("Status:", self.status_combo)
         
         # Remarks
@@ -176,17 +181,14 @@ class LaunchEditorDialog(QDialog):
     
     def load_launch_data(self):
         """Load existing launch data"""
-        launches = self.db.get_launches_by_date_range('1900-01-01', '2100-01-01')
-        launch = next((l for l in launches if l['launch_id'] == self.launch_id), None)
+        launch = self.db.get_launch_by_id(self.launch_id)
         
         if launch:
             if launch['launch_date']:
-                date_obj = datetime.strptime(launch['launch_date'], '%Y-%m-%d')
-                self.date_edit.setDate(QDate(date_obj.year, date_obj.month, date_obj.day))
+                self.date_edit.setDate(QDate.fromString(launch['launch_date'], 'yyyy-MM-dd'))
             
             if launch['launch_time']:
-                time_obj = datetime.strptime(launch['launch_time'], '%H:%M:%S').time()
-                self.time_edit.setTime(QTime(time_obj.hour, time_obj.minute, time_obj.second))
+                self.time_edit.setTime(QTime.fromString(launch['launch_time'], 'HH:mm:ss'))
             
             if launch['site_id']:
                 index = self.site_combo.findData(launch['site_id'])
@@ -206,17 +208,9 @@ class LaunchEditorDialog(QDialog):
             self.mission_edit.setText(launch.get('mission_name') or '')
             self.payload_edit.setText(launch.get('payload_name') or '')
             
-            notam_data = self.db.conn.cursor().execute("""
-                                                        SELECT ln.serial 
-                                                        FROM launch_notam AS ln 
-                                                        WHERE ln.launch_id == ?;
-                                                       """, 
-                                                       (str(launch['launch_id']),)
-                                                       )
-            notam_data = [dict(row) for row in notam_data.fetchall()]
-            for col in range(len(notam_data)):
-                serial = notam_data[col]["serial"]
-                self.notam_edit.setItem(0, col, QTableWidgetItem(serial))
+            if launch['notam_serials']:
+                for col, serial in enumerate(launch['notam_serials'].split('|')):
+                    self.notam_edit.setItem(0, col, QTableWidgetItem(serial))
 
             if launch.get('orbit_type'):
                 index = self.orbit_combo.findText(launch['orbit_type'])
@@ -256,12 +250,8 @@ class LaunchEditorDialog(QDialog):
             
             try:
                 # TODO validate NOTAM serial
-                self.db.conn.cursor().execute("""
-                                                INSERT OR IGNORE INTO notam (serial)
-                                                VALUES (?);
-                                                """,
-                                                (notam_data['serial'],)
-                                            )
+                self.db.q("INSERT OR IGNORE INTO notam (serial) VALUES (?)",
+                          (notam_data['serial'],))
                 self.db.conn.commit()
                               
                 QMessageBox.information(self, "Success", "NOTAM added successfully!")
@@ -474,55 +464,12 @@ class LaunchEditorDialog(QDialog):
                 self.db.update_launch(self.launch_id, launch_data)
                 
                 # Update NOTAM entries
-                old_notam = self.db.conn.cursor().execute("""
-                                                        SELECT ln.serial 
-                                                        FROM launch_notam AS ln 
-                                                        WHERE ln.launch_id == ?;
-                                                       """, 
-                                                       (self.launch_id,)
-                                                       )
-                old_notam = [dict(row) for row in old_notam.fetchall()]
-                
-                user_inputs = []
+                serials = []
                 for col in range(self.notam_edit.columnCount()):
-                    try:
-                        user_inputs.append(self.notam_edit.item(0, col).data(0))
-                    except:
-                        pass
-
-                for col in range(len(user_inputs)):
-                    new_serial = user_inputs[col]   
-                    try:
-                        old_serial = old_notam[col]['serial']
-                    except:
-                        old_serial = ""
-
-                    if new_serial != old_serial:
-                        if new_serial == "":
-                            self.db.conn.cursor().execute("""
-                                                            DELETE FROM launch_notam
-                                                            WHERE launch_id = ? AND serial = ?;
-                                                        """,
-                                                        (self.launch_id, old_serial,)
-                                                        )
-                            self.db.conn.cursor().execute("COMMIT;")
-                            continue
-                        
-                        self.db.conn.cursor().execute("BEGIN TRANSACTION;")
-                        self.db.conn.cursor().execute("""
-                                                        DELETE FROM launch_notam
-                                                        WHERE launch_id = ? AND serial = ?;
-                                                    """,
-                                                    (self.launch_id, old_serial,)
-                                                    )
-                        self.db.conn.cursor().execute("""
-                                                        INSERT OR IGNORE INTO launch_notam (launch_id, serial)
-                                                        VALUES (?, ?);
-                                                    """,
-                                                    (self.launch_id, new_serial,)
-                                                    )                 
-                        self.db.conn.cursor().execute("COMMIT;")
-                                      
+                    item = self.notam_edit.item(0, col)
+                    if item is not None:
+                        serials.append(item.text().strip())
+                self.db.set_launch_notams(self.launch_id, serials)
                 
                 QMessageBox.information(self, "Success", "Launch updated successfully!")
             else:
@@ -641,6 +588,8 @@ class MainWindow(QMainWindow):
         
         # Drop Zones view
         self.drop_zones_view = DropZonesView(self.db, parent=self)
+        # Only the re-entry timeline lists drop zones; no need for a full refresh_all
+        self.drop_zones_view.zones_changed.connect(self.reentry_timeline_view.update_timeline)
         self.tab_widget.addTab(self.drop_zones_view, "Drop Zones")
         
         # Rockets view
@@ -858,7 +807,7 @@ class MainWindow(QMainWindow):
         # Update all pad turnarounds from launch history
         self.db.update_all_pad_turnarounds_from_history()
         
-        self.timeline_view.update_timeline()
+        self.timeline_view.refresh()
         self.reentry_timeline_view.update_timeline()
         self.list_view.refresh()
         self.map_view.refresh()
@@ -17,11 +17,12 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                               QLabel, QComboBox, QPushButton, QDateEdit, 
                               QTextEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
                               QFormLayout)
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import Qt, QDate, QSignalBlocker, QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from matplotlib.patches import Polygon as MplPolygon
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 import matplotlib.pyplot as plt
 import numpy as np
 import re
@@ -32,8 +33,22 @@ try:
 except ImportError:
     CARTOPY_AVAILABLE = False
     print("Warning: cartopy not available, using simple matplotlib map")
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False  # Site hit tests fall back to a numpy scan
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# NOTAM vertex, e.g. N301900E1103700: hemisphere + DDMMSS latitude, hemisphere + DDDMMSS longitude
+_COORD_RE = re.compile(r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{2})')
+# Danger area vertex list following "BOUNDED BY:", up to the closing period (length bounded)
+_BOUNDED_RE = re.compile(r'BOUNDED BY:\s*([^.]{0,4096})', re.IGNORECASE)
+
+# Shared slerp parameter for great circle paths; float32 is ample for on-screen vertices
+_GC_T = np.linspace(0.0, 1.0, 64, dtype=np.float32)
 
 
 class NotamParser:
@@ -50,8 +65,7 @@ class NotamParser:
         - E/W followed by DDDMMSS (degrees, minutes, seconds)
         """
         # Match patterns like N301900E1103700
-        pattern = r'([NS])(\d{2})(\d{2})(\d{2})([EW])(\d{3})(\d{2})(\d{2})'
-        match = re.match(pattern, coord_str.strip())
+        match = _COORD_RE.match(coord_str.strip())
         
         if not match:
             return None
@@ -80,41 +94,81 @@ class NotamParser:
          N301900E1103700-N301700E1110000-N293800E1105700-N294000E1103400, 
          BACK TO START."
         
-        Returns: [(lat1, lon1), (lat2, lon2), ...] or None
+        Returns: (N, 2) float array of [lat, lon] rows, or None
         """
         # Find the bounded area section
-        bounded_match = re.search(r'BOUNDED BY:\s*([^.]+)', notam_text, re.IGNORECASE)
+        bounded_match = _BOUNDED_RE.search(notam_text)
         if not bounded_match:
             return None
         
         bounded_text = bounded_match.group(1)
         
-        # Extract coordinate strings (pattern: N123456E1234567)
-        coord_pattern = r'[NS]\d{6}[EW]\d{7}'
-        coord_strings = re.findall(coord_pattern, bounded_text)
+        # Extract coordinate fields (pattern: N123456E1234567)
+        matches = _COORD_RE.findall(bounded_text)
         
-        if not coord_strings:
+        if not matches:
             return None
         
-        # Parse each coordinate
-        coordinates = []
-        for coord_str in coord_strings:
-            coord = NotamParser.parse_coordinate(coord_str)
-            if coord:
-                coordinates.append(coord)
+        # Convert every vertex to decimal degrees in one pass
+        arr = np.array(matches)
+        fields = arr[:, [1, 2, 3, 5, 6, 7]].astype(np.int16)
+        lat = fields[:, 0] + fields[:, 1] / 60 + fields[:, 2] / 3600
+        lon = fields[:, 3] + fields[:, 4] / 60 + fields[:, 5] / 3600
+        
+        # Apply direction
+        lat = np.where(arr[:, 0] == 'S', -lat, lat)
+        lon = np.where(arr[:, 4] == 'W', -lon, lon)
+        
+        return np.column_stack([lat, lon])
+    
+    @staticmethod
+    def simplify_polygon(coordinates, tolerance=0.005):
+        """
+        Ramer-Douglas-Peucker simplification of a NOTAM vertex array
+        
+        Drops vertices within tolerance degrees (~500 m) of the line through their
+        neighbours, which is below screen resolution at any map zoom.
+        """
+        points = np.asarray(coordinates, dtype=float)
+        if len(points) <= 3:
+            return points
+        
+        keep = np.zeros(len(points), dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, len(points) - 1)]
         
-        return coordinates if coordinates else None
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            
+            # Perpendicular distance of the inner vertices from the start-end chord
+            chord = points[end] - points[start]
+            offsets = points[start + 1:end] - points[start]
+            chord_len = np.hypot(chord[0], chord[1])
+            if chord_len == 0:
+                dists = np.hypot(offsets[:, 0], offsets[:, 1])
+            else:
+                dists = np.abs(chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0]) / chord_len
+            
+            index = int(np.argmax(dists))
+            if dists[index] > tolerance:
+                split = start + 1 + index
+                keep[split] = True
+                stack.append((start, split))
+                stack.append((split, end))
+        
+        simplified = points[keep]
+        return simplified if len(simplified) >= 3 else points
     
     @staticmethod
     def calculate_polygon_center(coordinates):
         """Calculate centroid of polygon"""
-        if not coordinates:
+        if coordinates is None or len(coordinates) == 0:
             return None
         
-        lats = [c[0] for c in coordinates]
-        lons = [c[1] for c in coordinates]
-        
-        return (np.mean(lats), np.mean(lons))
+        lat, lon = np.mean(coordinates, axis=0)
+        return (lat, lon)
 
 
 class MapView(QWidget):
@@ -129,11 +183,29 @@ class MapView(QWidget):
         self.current_filter = 'next_30'
         self.custom_start = None
         self.custom_end = None
-        self.site_markers = {}  # Store site_id -> marker mapping
-        self.site_labels = {}   # Store site_id -> label mapping
+        # Active site markers as parallel arrays, shared by the scatter and hit tests
+        self._site_ids = np.empty(0, dtype=np.int64)
+        self._site_lons = np.empty(0)
+        self._site_lats = np.empty(0)
+        self._site_tree = None  # KD-tree over (lon, lat) for hit tests, when scipy is available
+        self.site_scatter = None  # Single scatter collection holding every site marker
+        self.site_labels = {}   # Store site_id -> label mapping, created on first hover
+        self._site_label_data = {}  # site_id -> (lon, lat, text) for labels not yet created
         self.selected_launch = None  # Currently selected launch
-        self.notam_polygons = []  # Store NOTAM polygon patches
+        self._notam_coll = None   # One PolyCollection for all NOTAM areas, updated in place
+        self._traj_text = None    # Trajectory info box, updated in place
+        self._notam_verts = []    # Its current [lon, lat] vertex arrays and RGBA colors
+        self._notam_colors = []
         self.notam_paths = []    # Store great circle path lines
+        self._notam_cache = {}   # launch_id -> (parsed NOTAM areas, simplified areas for drawing)
+        self._overlay_artists = []  # Selection/NOTAM artists drawn by blitting over the base map
+        self._background = None     # Canvas snapshot of the base map without overlays
+        self._feature_artists = []  # Cartopy land/ocean/coast/border artists
+        self._gridliner = None
+        self._basemap_image = None  # Rasterized snapshot of the features, shown in their place
+        self._basemap_key = None    # (xlim, ylim, canvas size) the snapshot was rendered at
+        self._last_parsed_text = None    # Last custom NOTAM text parsed, and its result
+        self._last_parsed_coords = None
         self.init_ui()
     
     def init_ui(self):
@@ -178,12 +250,12 @@ class MapView(QWidget):
         # NOTAM Checkboxes
         self.show_notam_check = QCheckBox("NOTAM Areas")
         self.show_notam_check.setChecked(True)
-        self.show_notam_check.stateChanged.connect(self.update_map)
+        self.show_notam_check.stateChanged.connect(self.update_overlays)
         main_controls.addWidget(self.show_notam_check)
         
         self.show_path_check = QCheckBox("Flight Path")
         self.show_path_check.setChecked(True)
-        self.show_path_check.stateChanged.connect(self.update_map)
+        self.show_path_check.stateChanged.connect(self.update_overlays)
         main_controls.addWidget(self.show_path_check)
         
         main_controls.addStretch()
@@ -238,7 +310,7 @@ class MapView(QWidget):
         
         # ===== MAP =====
         # No fixed size - let it fill available space dynamically
-        self.figure = Figure(facecolor='#0f0f1e')
+        self.figure = Figure(facecolor='#0f0f1e', constrained_layout=False)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(
             self.canvas.sizePolicy().Policy.Expanding,
@@ -254,6 +326,12 @@ class MapView(QWidget):
         self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.canvas.mpl_connect('button_press_event', self.on_mouse_click)
         self.canvas.mpl_connect('scroll_event', self.on_mouse_scroll)  # Mouse wheel zoom
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        
+        # Coalesce bursts of hover/scroll redraws into one per 30 ms
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.canvas.draw_idle)
         
         # Status label
         self.status_label = QLabel("Loading map...")
@@ -262,6 +340,7 @@ class MapView(QWidget):
         self.setLayout(layout)
         
         # Initial map render
+        self.create_map_axes()
         self.update_map()
         self.populate_launch_combo()
     
@@ -314,21 +393,16 @@ class MapView(QWidget):
     def populate_launch_combo(self):
         """Populate launch selection dropdown"""
         start_date, end_date = self.get_date_range()
-        launches = self.db.get_launches_by_date_range(start_date, end_date)
-        
-        self.launch_combo.blockSignals(True)
-        self.launch_combo.clear()
-        self.launch_combo.addItem("-- All Launches --", None)
+        launches = self.db.get_launch_choices(start_date, end_date)
         
-        for launch in launches:
-            date = launch.get('launch_date', 'Unknown')
-            mission = launch.get('mission_name', 'Unknown')
-            site = launch.get('location', 'Unknown')
-            
-            display = f"{date} - {mission} ({site})"
-            self.launch_combo.addItem(display, launch['launch_id'])
+        displays = [f"{launch['launch_date']} - {launch['mission_name']} ({launch['location']})"
+                    for launch in launches]
         
-        self.launch_combo.blockSignals(False)
+        with QSignalBlocker(self.launch_combo):
+            self.launch_combo.clear()
+            self.launch_combo.addItems(["-- All Launches --"] + displays)
+            for index, launch in enumerate(launches, start=1):
+                self.launch_combo.setItemData(index, launch['launch_id'])
     
     def on_launch_selected(self, index):
         """Handle launch selection from dropdown"""
@@ -338,11 +412,9 @@ class MapView(QWidget):
             self.selected_launch = None
         else:
             # Get full launch details
-            start_date, end_date = self.get_date_range()
-            launches = self.db.get_launches_by_date_range(start_date, end_date)
-            self.selected_launch = next((l for l in launches if l['launch_id'] == launch_id), None)
+            self.selected_launch = self.db.get_launch_by_id(launch_id)
         
-        self.update_map()
+        self.update_overlays()
         
         # Don't auto-focus - let user click Focus button to zoom
     
@@ -363,34 +435,21 @@ class MapView(QWidget):
         
         # Also check for custom NOTAM
         if 'custom_notam' in self.selected_launch:
-            if notam_coords is None:
-                notam_coords = []
-            notam_coords.extend(self.selected_launch['custom_notam'])
+            custom = self.selected_launch['custom_notam']
+            notam_coords = custom if notam_coords is None else np.vstack([notam_coords, custom])
         
         # Get canvas aspect ratio (width / height)
         fig_width, fig_height = self.figure.get_size_inches()
         canvas_aspect = fig_width / fig_height
         
-        if notam_coords and len(notam_coords) > 0:
-            # Calculate bounding box that includes launch site and all NOTAMs
-            all_lats = [lat] + [c[0] for c in notam_coords]
-            all_lons = [lon] + [c[1] for c in notam_coords]
-            
-            min_lat = min(all_lats)
-            max_lat = max(all_lats)
-            min_lon = min(all_lons)
-            max_lon = max(all_lons)
+        if notam_coords is not None:
+            # Calculate [lat, lon] bounding box that includes launch site and all NOTAMs
+            points = np.vstack([[lat, lon], notam_coords])
+            mins, maxs = points.min(axis=0), points.max(axis=0)
+            ranges = maxs - mins
             
-            # Add padding (30%)
-            lat_range = max_lat - min_lat
-            lon_range = max_lon - min_lon
-            
-            padding_lat = max(lat_range * 0.30, 2.0)
-            padding_lon = max(lon_range * 0.30, 2.0)
-            
-            # Calculate ranges with padding
-            padded_lat_range = lat_range + 2*padding_lat
-            padded_lon_range = lon_range + 2*padding_lon
+            # Calculate ranges with padding (30%, at least 2 degrees each side)
+            padded_lat_range, padded_lon_range = ranges + 2 * np.maximum(ranges * 0.30, 2.0)
             
             # Adjust ranges to match canvas aspect ratio
             # Aspect ratio = lon_range / lat_range
@@ -404,8 +463,7 @@ class MapView(QWidget):
                 padded_lat_range = padded_lon_range / canvas_aspect
             
             # Center the view
-            center_lat = (min_lat + max_lat) / 2
-            center_lon = (min_lon + max_lon) / 2
+            center_lat, center_lon = (mins + maxs) / 2
             
             self.ax.set_extent([
                 center_lon - padded_lon_range/2,
@@ -437,48 +495,43 @@ class MapView(QWidget):
         Returns:
             dict with 'distance_km', 'distance_nm', 'azimuth', 'inclination'
         """
-        from math import radians, degrees, sin, cos, atan2, sqrt, asin, acos
+        info = self.calculate_great_circle_info_vec(lat1, lon1, [lat2], [lon2])
+        return {key: float(values[0]) for key, values in info.items()}
+    
+    @staticmethod
+    def calculate_great_circle_info_vec(lat1, lon1, lats2, lons2):
+        """
+        Great circle distance, azimuth, and inclination from one point to many
         
+        Returns:
+            dict with 'distance_km', 'distance_nm', 'azimuth', 'inclination' arrays
+        """
         # Convert to radians
-        lat1_rad = radians(lat1)
-        lon1_rad = radians(lon1)
-        lat2_rad = radians(lat2)
-        lon2_rad = radians(lon2)
+        lat1_rad, lon1_rad = np.radians(lat1), np.radians(lon1)
+        lat2_rad = np.radians(np.asarray(lats2, dtype=float))
+        lon2_rad = np.radians(np.asarray(lons2, dtype=float))
         
         # Haversine formula for distance
         dlat = lat2_rad - lat1_rad
         dlon = lon2_rad - lon1_rad
         
-        a = sin(dlat/2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon/2)**2
-        c = 2 * asin(sqrt(a))
+        a = np.sin(dlat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon/2)**2
+        c = 2 * np.arcsin(np.sqrt(a))
         
         # Earth radius in km
         earth_radius_km = 6371.0
         distance_km = earth_radius_km * c
         distance_nm = distance_km * 0.539957  # Convert to nautical miles
         
-        # Calculate azimuth (bearing) from point 1 to point 2
-        y = sin(lon2_rad - lon1_rad) * cos(lat2_rad)
-        x = cos(lat1_rad) * sin(lat2_rad) - sin(lat1_rad) * cos(lat2_rad) * cos(lon2_rad - lon1_rad)
-        azimuth = (degrees(atan2(y, x)) + 360) % 360  # Normalize to 0-360
+        # Calculate azimuth (bearing) from point 1 to each point 2
+        y = np.sin(dlon) * np.cos(lat2_rad)
+        x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon)
+        azimuth = (np.degrees(np.arctan2(y, x)) + 360) % 360  # Normalize to 0-360
         
-        # Calculate orbital inclination from launch azimuth and latitude
-        # Formula: cos(i) = cos(lat) * sin(azimuth)
-        # This gives the inclination of the orbit based on the launch trajectory
-        azimuth_rad = radians(azimuth)
-        
-        # The inclination formula accounts for the launch latitude and direction
-        cos_inclination = cos(lat1_rad) * sin(azimuth_rad)
-        
-        # Clamp to [-1, 1] to avoid numerical errors with acos
-        cos_inclination = max(-1.0, min(1.0, cos_inclination))
-        
-        inclination = degrees(acos(cos_inclination))
-        
-        # Ensure inclination is in the range [0, 180]
-        # For retrograde orbits (azimuth > 180), inclination > 90
-        if inclination < 0:
-            inclination = abs(inclination)
+        # Orbital inclination from launch azimuth and latitude: cos(i) = cos(lat) * sin(azimuth)
+        # Clamp to [-1, 1] to avoid numerical errors with arccos; result is in [0, 180]
+        cos_inclination = np.clip(np.cos(lat1_rad) * np.sin(np.radians(azimuth)), -1.0, 1.0)
+        inclination = np.degrees(np.arccos(cos_inclination))
         
         return {
             'distance_km': distance_km,
@@ -487,8 +540,16 @@ class MapView(QWidget):
             'inclination': inclination
         }
     
-    def get_notam_coordinates(self, launch_id):
-        """Get all NOTAM coordinates for a launch"""
+    def get_notam_areas(self, launch_id, simplified=False):
+        """Get the parsed (or simplified) NOTAM areas for a launch, cached until refresh()"""
+        if launch_id not in self._notam_cache:
+            self._notam_cache[launch_id] = self.load_notam_areas(launch_id)
+        
+        areas, simplified_areas = self._notam_cache[launch_id]
+        return simplified_areas if simplified else areas
+    
+    def load_notam_areas(self, launch_id):
+        """Query and parse a launch's NOTAM areas, returning (areas, simplified areas)"""
         cursor = self.db.conn.cursor()
         cursor.execute("""
             SELECT n.serial, n.notam_text
@@ -499,14 +560,19 @@ class MapView(QWidget):
         
         notam_records = cursor.fetchall()
         
-        all_coords = []
+        areas = []
         for record in notam_records:
             notam_text = record[1] if len(record) > 1 else record[0]
             coordinates = NotamParser.parse_notam_area(notam_text)
-            if coordinates:
-                all_coords.extend(coordinates)
+            if coordinates is not None:
+                areas.append(coordinates)
         
-        return all_coords if all_coords else None
+        return areas, [NotamParser.simplify_polygon(coordinates) for coordinates in areas]
+    
+    def get_notam_coordinates(self, launch_id):
+        """Get all NOTAM coordinates for a launch as one (N, 2) [lat, lon] array"""
+        areas = self.get_notam_areas(launch_id)
+        return np.vstack(areas) if areas else None
     
     def parse_custom_notam(self):
         """Parse custom NOTAM text and display on map"""
@@ -515,17 +581,20 @@ class MapView(QWidget):
         if not notam_text:
             return
         
-        # Parse NOTAM coordinates
-        coordinates = NotamParser.parse_notam_area(notam_text)
+        # Parse NOTAM coordinates, reusing the last result for unchanged text
+        if notam_text != self._last_parsed_text:
+            self._last_parsed_text = notam_text
+            self._last_parsed_coords = NotamParser.parse_notam_area(notam_text)
+        coordinates = self._last_parsed_coords
         
-        if not coordinates:
+        if coordinates is None:
             self.status_label.setText("⚠️ Could not parse NOTAM coordinates. Check format.")
             return
         
         # Store as custom NOTAM for the selected launch
         if self.selected_launch:
             self.selected_launch['custom_notam'] = coordinates
-            self.update_map()
+            self.update_overlays()
             self.status_label.setText(f"✅ Custom NOTAM parsed: {len(coordinates)} vertices")
         else:
             self.status_label.setText("⚠️ Select a launch first to associate NOTAM")
@@ -536,34 +605,69 @@ class MapView(QWidget):
             del self.selected_launch['custom_notam']
         
         self.custom_notam_text.clear()
-        self.update_map()
+        self.update_overlays()
         self.status_label.setText("Custom NOTAM cleared")
     
-    def draw_great_circle(self, ax, lon1, lat1, lon2, lat2, color='#ff3838', linewidth=2, alpha=0.8):
-        """Draw great circle path between two points"""
-        if not CARTOPY_AVAILABLE:
-            # Simple straight line fallback
-            ax.plot([lon1, lon2], [lat1, lat2], 
-                   color=color, linewidth=linewidth, alpha=alpha, 
-                   linestyle='-', transform=ccrs.Geodetic())
-            return
+    @staticmethod
+    def great_circle_segments(lat1, lon1, lats2, lons2):
+        """
+        Interpolate great circle paths from one point to many (slerp on the unit sphere)
         
-        # Use Geodetic transform for curved path (SOLID LINE)
-        ax.plot([lon1, lon2], [lat1, lat2], 
-               color=color, linewidth=linewidth, alpha=alpha,
-               linestyle='-', transform=ccrs.Geodetic())
+        Returns: (N, len(_GC_T), 2) float64 array of [lon, lat] vertices
+        """
+        def unit_vectors(lats, lons):
+            lat_rad, lon_rad = np.radians(lats), np.radians(lons)
+            return np.stack([np.cos(lat_rad) * np.cos(lon_rad),
+                             np.cos(lat_rad) * np.sin(lon_rad),
+                             np.sin(lat_rad)], axis=-1)
+        
+        p1 = unit_vectors(np.asarray(lat1, dtype=np.float32), np.asarray(lon1, dtype=np.float32))
+        p2 = unit_vectors(np.asarray(lats2, dtype=np.float32), np.asarray(lons2, dtype=np.float32))
+        p1 = np.broadcast_to(p1, p2.shape)
+        
+        t = _GC_T
+        omega = np.arccos(np.clip(np.sum(p1 * p2, axis=-1), -1.0, 1.0))[:, None]
+        sin_omega = np.sin(omega)
+        
+        # Coincident endpoints fall back to linear weights
+        with np.errstate(invalid='ignore', divide='ignore'):
+            w1 = np.where(sin_omega > 1e-6, np.sin((1 - t) * omega) / sin_omega, 1 - t)
+            w2 = np.where(sin_omega > 1e-6, np.sin(t * omega) / sin_omega, t)
+        
+        points = w1[..., None] * p1[:, None, :] + w2[..., None] * p2[:, None, :]
+        lats = np.degrees(np.arctan2(points[..., 2], np.hypot(points[..., 0], points[..., 1])))
+        # Unwrap so paths crossing the antimeridian stay continuous
+        lons = np.degrees(np.unwrap(np.arctan2(points[..., 1], points[..., 0]), axis=1))
+        
+        return np.stack([lons, lats], axis=-1).astype(np.float64)
     
-    def update_map(self):
-        """Update the map display"""
-        self.figure.clear()
-        
-        # Calculate canvas aspect ratio for consistent fill
-        fig_width, fig_height = self.figure.get_size_inches()
-        canvas_aspect = fig_width / fig_height if fig_height > 0 else 2.4
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def trajectory_paths(lat1, lon1, lats2, lons2):
+        """
+        Trajectory info and great circle vertices from a launch site to NOTAM centers
         
-        # Get launches for current date range
-        start_date, end_date = self.get_date_range()
-        launches = self.db.get_launches_by_date_range(start_date, end_date)
+        Memoized on the (rounded, tuple) coordinates: results only change with the
+        selected launch or its NOTAMs, not with overlay toggles and redraws.
+        """
+        return (MapView.calculate_great_circle_info_vec(lat1, lon1, lats2, lons2),
+                MapView.great_circle_segments(lat1, lon1, lats2, lons2))
+    
+    def draw_great_circles(self, ax, segments, colors, linewidth=2, alpha=0.8):
+        """Draw great circle paths as a single LineCollection"""
+        paths = LineCollection(segments, colors=colors, linewidths=linewidth, alpha=alpha,
+                               linestyle='-', zorder=6,
+                               transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None)
+        ax.add_collection(paths)
+        return paths
+    
+    def create_map_axes(self):
+        """Create the map axes and its static features once; update_map reuses them"""
+        self.figure.clear()
+        self._feature_artists = []
+        self._gridliner = None
+        self._basemap_image = None
+        self._basemap_key = None
         
         # Create map
         if CARTOPY_AVAILABLE:
@@ -571,14 +675,16 @@ class MapView(QWidget):
             # Keep equal aspect for proper geographic proportions
             
             # Dark theme ocean and land
-            self.ax.add_feature(cfeature.OCEAN, facecolor='#0f3460', zorder=0)
-            self.ax.add_feature(cfeature.LAND, facecolor='#16213e', zorder=1)
-            
-            # Purple borders and coastlines
-            self.ax.add_feature(cfeature.COASTLINE, linewidth=1.0, 
-                              edgecolor='#533483', alpha=0.9, zorder=2)
-            self.ax.add_feature(cfeature.BORDERS, linewidth=1.2, 
-                              edgecolor='#533483', alpha=0.9, zorder=2)
+            self._feature_artists = [
+                self.ax.add_feature(cfeature.OCEAN, facecolor='#0f3460', zorder=0),
+                self.ax.add_feature(cfeature.LAND, facecolor='#16213e', zorder=1),
+                
+                # Purple borders and coastlines
+                self.ax.add_feature(cfeature.COASTLINE, linewidth=1.0, 
+                                  edgecolor='#533483', alpha=0.9, zorder=2),
+                self.ax.add_feature(cfeature.BORDERS, linewidth=1.2, 
+                                  edgecolor='#533483', alpha=0.9, zorder=2),
+            ]
             
             # Gridlines in purple - labels INSIDE the map
             gl = self.ax.gridlines(draw_labels=True, linewidth=0.5, 
@@ -604,38 +710,84 @@ class MapView(QWidget):
             except:
                 pass  # Some cartopy versions don't support this
             
-            # Set global extent to fill canvas based on aspect ratio
-            # Base latitude range: -75 to 75 (150 degrees total)
-            lat_range = 150
-            # Calculate longitude range to match aspect ratio
-            lon_range = lat_range * canvas_aspect
+            self._gridliner = gl
             
-            # Cap longitude at 360 degrees (full world)
-            lon_range = min(lon_range, 360)
+            # Zoom/pan makes the rasterized basemap stale; draw the vector features instead
+            self.ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+            self.ax.callbacks.connect('ylim_changed', self.on_limits_changed)
+        else:
+            # Simple matplotlib fallback
+            self.ax = self.figure.add_subplot(111)
             
-            # Center on 0, 0
+            self.ax.set_facecolor('#0f3460')
+            self.ax.set_xlabel('Longitude', color='#533483')
+            self.ax.set_ylabel('Latitude', color='#533483')
+            self.ax.tick_params(colors='#533483')
+            self.ax.grid(True, alpha=0.3, color='#533483', linewidth=0.5)
+        
+        # NOTAM areas share one collection for the life of the axes
+        self._notam_coll = PolyCollection([], linewidths=2, zorder=5, animated=True,
+                                          **({'transform': ccrs.PlateCarree()} if CARTOPY_AVAILABLE else {}))
+        self.ax.add_collection(self._notam_coll)
+        
+        # Trajectory info box, reused for every NOTAM path
+        # Position the text box in the upper left corner of the map
+        # Use axes coordinates (0-1 range) so it stays in same place regardless of zoom
+        self._traj_text = self.ax.text(0.02, 0.98, "",
+                                       transform=self.ax.transAxes,  # Use axes coordinates, not data coordinates
+                                       fontsize=10,
+                                       color='white',
+                                       verticalalignment='top',
+                                       horizontalalignment='left',
+                                       bbox=dict(boxstyle='round,pad=0.5',
+                                               facecolor='#1a1a2e',
+                                               edgecolor='#533483',
+                                               alpha=0.9,
+                                               linewidth=1.5),
+                                       zorder=100,  # High zorder to appear on top
+                                       visible=False, animated=True)
+    
+    def update_map(self):
+        """Update the map display"""
+        # Remove last render's dynamic artists; the axes and base features are kept
+        self.clear_overlays()
+        if self.site_scatter is not None:
+            self.site_scatter.remove()
+            self.site_scatter = None
+        for label in self.site_labels.values():
+            label.remove()
+        # Forget removed labels before rasterize_basemap() can trigger a draw_event
+        self.site_labels = {}
+        self._site_label_data = {}
+        
+        # Calculate canvas aspect ratio for consistent fill
+        fig_width, fig_height = self.figure.get_size_inches()
+        canvas_aspect = fig_width / fig_height if fig_height > 0 else 2.4
+        
+        # Get launches for current date range
+        start_date, end_date = self.get_date_range()
+        launches = self.db.get_launches_by_date_range(start_date, end_date)
+        
+        # Match extent to canvas aspect ratio
+        # Base latitude range: -75 to 75 (150 degrees total)
+        lat_range = 150
+        # Calculate longitude range to match aspect ratio, capped at 360 degrees (full world)
+        lon_range = min(lat_range * canvas_aspect, 360)
+        
+        # Center on 0, 0
+        if CARTOPY_AVAILABLE:
             self.ax.set_extent([
                 -lon_range/2, 
                 lon_range/2, 
                 -lat_range/2, 
                 lat_range/2
             ], crs=ccrs.PlateCarree())
-            
         else:
-            # Simple matplotlib fallback
-            self.ax = self.figure.add_subplot(111)
-            
-            # Match aspect ratio to canvas using pre-calculated value
-            lat_range = 150  # -75 to 75
-            lon_range = min(lat_range * canvas_aspect, 360)
-            
             self.ax.set_xlim(-lon_range/2, lon_range/2)
             self.ax.set_ylim(-lat_range/2, lat_range/2)
-            self.ax.set_facecolor('#0f3460')
-            self.ax.set_xlabel('Longitude', color='#533483')
-            self.ax.set_ylabel('Latitude', color='#533483')
-            self.ax.tick_params(colors='#533483')
-            self.ax.grid(True, alpha=0.3, color='#533483', linewidth=0.5)
+        
+        # Draw the static features as one cached image at this extent
+        self.rasterize_basemap()
         
         # Plot launch sites
         site_activity = {}  # site_id -> launch_count
@@ -645,11 +797,9 @@ class MapView(QWidget):
             if site_id:
                 site_activity[site_id] = site_activity.get(site_id, 0) + 1
         
-        self.site_markers = {}
-        self.site_labels = {}
-        
         # Get all sites
         all_sites = self.db.get_all_sites()
+        site_ids, lons, lats, colors = [], [], [], []
         
         for site in all_sites:
             lat = site.get('latitude')
@@ -673,56 +823,34 @@ class MapView(QWidget):
             else:
                 continue  # Skip inactive sites
             
-            # Plot marker
-            marker = self.ax.plot(lon, lat, 'o', color=color, markersize=8,
-                                 markeredgecolor='white', markeredgewidth=1,
-                                 transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
-                                 zorder=10)[0]
+            # Collect marker, plotted below in one scatter call
+            site_ids.append(site_id)
+            lons.append(lon)
+            lats.append(lat)
+            colors.append(color)
             
-            self.site_markers[site_id] = marker
-            
-            # Label (hidden by default)
+            # Label text; the artist is only created when first shown
             location = site.get('location', 'Unknown')
             pad = site.get('launch_pad', '')
-            label_text = f"{location}\n{pad}\n({count} launches)"
-            
-            label = self.ax.text(lon, lat + 0.5, label_text,
-                               fontsize=8, color='white',
-                               bbox=dict(boxstyle='round,pad=0.3', 
-                                       facecolor='#1a1a2e', 
-                                       edgecolor='#533483', 
-                                       alpha=0.9),
-                               ha='center', va='bottom',
-                               transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
-                               zorder=15, visible=False)
-            
-            self.site_labels[site_id] = label
+            self._site_label_data[site_id] = (lon, lat, f"{location}\n{pad}\n({count} launches)")
         
-        # Highlight selected launch site
-        if self.selected_launch:
-            lat = self.selected_launch.get('latitude')
-            lon = self.selected_launch.get('longitude')
-            
-            if lat is not None and lon is not None:
-                # Highlight with red circle (filled)
-                self.ax.plot(lon, lat, 'o', color='#ff3838', markersize=15,
-                           markeredgecolor='white', markeredgewidth=2,
-                           transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
-                           zorder=20)
-                
-                # Show label permanently for selected
-                site_id = self.selected_launch.get('site_id')
-                if site_id in self.site_labels:
-                    self.site_labels[site_id].set_visible(True)
-                
-                # Draw NOTAM areas if enabled
-                if self.show_notam_check.isChecked():
-                    self.draw_notam_areas()
+        self._site_ids = np.array(site_ids, dtype=np.int64)
+        self._site_lons = np.array(lons, dtype=float)
+        self._site_lats = np.array(lats, dtype=float)
+        self._site_tree = None
+        if SCIPY_AVAILABLE and site_ids:
+            self._site_tree = cKDTree(np.column_stack([self._site_lons, self._site_lats]))
         
-        self.canvas.draw()
+        if site_ids:
+            self.site_scatter = self.ax.scatter(self._site_lons, self._site_lats, c=colors, s=64,
+                                                edgecolors='white', linewidths=1,
+                                                transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
+                                                zorder=10)
         
-        # Use tight layout with minimal padding to maximize map area
-        self.figure.tight_layout(pad=0.1)
+        # Selected launch and NOTAM overlays, blitted over the base map on each draw
+        self.draw_overlays()
+        
+        self.canvas.draw()
         
         # Update status
         filter_names = {
@@ -740,6 +868,161 @@ class MapView(QWidget):
             f"{len(launches)} launches | {active_sites} active sites | {filter_name}"
         )
     
+    def get_site_label(self, site_id):
+        """Get the hover label for a site, creating the text artist on first use"""
+        if site_id in self.site_labels:
+            return self.site_labels[site_id]
+        if site_id not in self._site_label_data:
+            return None
+        
+        label = self.create_site_label(*self._site_label_data[site_id])
+        self.site_labels[site_id] = label
+        return label
+    
+    def create_site_label(self, lon, lat, label_text):
+        """Create a hidden site label text artist, blitted rather than part of the base map"""
+        return self.ax.text(lon, lat + 0.5, label_text,
+                           fontsize=8, color='white',
+                           bbox=dict(boxstyle='round,pad=0.3', 
+                                   facecolor='#1a1a2e', 
+                                   edgecolor='#533483', 
+                                   alpha=0.9),
+                           ha='center', va='bottom',
+                           transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
+                           zorder=15, visible=False, animated=True)
+    
+    def rasterize_basemap(self):
+        """
+        Render the cartopy features once for the current extent and canvas size and
+        show them as a single image, so later redraws skip the vector features
+        """
+        if not CARTOPY_AVAILABLE:
+            return
+        
+        x_lim, y_lim = self.ax.get_xlim(), self.ax.get_ylim()
+        key = (x_lim, y_lim, self.canvas.get_width_height())
+        
+        if key != self._basemap_key:
+            # Draw only the features: overlays and sites are cleared by update_map
+            self.show_basemap_image(False)
+            self.set_gridliner_visible(False)
+            self.canvas.draw()
+            
+            # Crop the axes area out of the canvas buffer (rows run top to bottom)
+            buffer = np.asarray(self.canvas.buffer_rgba())
+            bbox = self.ax.bbox
+            height = buffer.shape[0]
+            pixels = buffer[int(round(height - bbox.y1)):int(round(height - bbox.y0)),
+                            int(round(bbox.x0)):int(round(bbox.x1))].copy()
+            self.set_gridliner_visible(True)
+            
+            extent = (x_lim[0], x_lim[1], y_lim[0], y_lim[1])
+            if self._basemap_image is None:
+                self._basemap_image = self.ax.imshow(pixels, extent=extent, origin='upper',
+                                                     transform=self.ax.projection,
+                                                     interpolation='nearest', zorder=0)
+            else:
+                self._basemap_image.set_data(pixels)
+                self._basemap_image.set_extent(extent)
+            self._basemap_key = key
+        
+        self.show_basemap_image(True)
+    
+    def show_basemap_image(self, show):
+        """Swap between the rasterized basemap image and the live cartopy features"""
+        if self._basemap_image is not None:
+            self._basemap_image.set_visible(show)
+        for artist in self._feature_artists:
+            artist.set_visible(not show)
+    
+    def set_gridliner_visible(self, visible):
+        """Show or hide the gridlines so they are not baked into the basemap image"""
+        try:
+            self._gridliner.set_visible(visible)
+        except AttributeError:
+            pass  # Older cartopy gridliners are not artists
+    
+    def on_limits_changed(self, ax):
+        """Zoom/pan invalidates the basemap image; fall back to the vector features"""
+        self.show_basemap_image(False)
+    
+    def add_overlay(self, artist):
+        """Register an artist as part of the blitted overlay layer"""
+        artist.set_animated(True)
+        self._overlay_artists.append(artist)
+        return artist
+    
+    def draw_overlays(self):
+        """Create the selected launch highlight, label and NOTAM overlay artists"""
+        if not self.selected_launch:
+            return
+        
+        lat = self.selected_launch.get('latitude')
+        lon = self.selected_launch.get('longitude')
+        
+        if lat is None or lon is None:
+            return
+        
+        # Highlight with red circle (filled)
+        self.add_overlay(self.ax.plot(lon, lat, 'o', color='#ff3838', markersize=15,
+                                      markeredgecolor='white', markeredgewidth=2,
+                                      transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
+                                      zorder=20)[0])
+        
+        # Show label permanently for selected
+        label_data = self._site_label_data.get(self.selected_launch.get('site_id'))
+        if label_data:
+            self.add_overlay(self.create_site_label(*label_data)).set_visible(True)
+        
+        # Draw NOTAM areas if enabled
+        if self.show_notam_check.isChecked():
+            self.draw_notam_areas()
+    
+    def clear_overlays(self):
+        """Remove the overlay artists from the axes"""
+        for artist in self._overlay_artists:
+            artist.remove()
+        self._overlay_artists = []
+        self.notam_paths = []
+        
+        self._notam_verts = []
+        self._notam_colors = []
+        self._notam_coll.set_verts([])
+        self._traj_text.set_visible(False)
+    
+    def update_overlays(self):
+        """Redraw only the overlay layer, blitting it over the cached base map"""
+        self.clear_overlays()
+        self.draw_overlays()
+        self.blit_overlays()
+    
+    def blit_overlays(self):
+        """Repaint the overlays and hover labels over the cached base map"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self._background)
+        self.draw_overlay_artists()
+        self.canvas.blit(self.figure.bbox)
+    
+    def draw_overlay_artists(self):
+        """Draw the animated overlay artists and visible hover labels onto the canvas"""
+        if self._notam_verts:
+            self.figure.draw_artist(self._notam_coll)
+        if self._traj_text.get_visible():
+            self.figure.draw_artist(self._traj_text)
+        for artist in self._overlay_artists:
+            self.figure.draw_artist(artist)
+        for label in self.site_labels.values():
+            if label.get_visible():
+                self.figure.draw_artist(label)
+    
+    def on_draw(self, event):
+        """Cache the freshly drawn base map, then draw the overlays on top of it"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_overlay_artists()
+    
     def draw_notam_areas(self):
         """Draw NOTAM danger areas for selected launch"""
         if not self.selected_launch:
@@ -752,91 +1035,64 @@ class MapView(QWidget):
         if launch_lat is None or launch_lon is None:
             return
         
-        # Get NOTAMs for this launch from database
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT n.serial, n.notam_text
-            FROM launch_notam ln
-            JOIN notam n ON ln.serial = n.serial
-            WHERE ln.launch_id = ?
-        """, (launch_id,))
+        # Parsed NOTAM areas for this launch, drawn together as one collection
+        areas = [(coordinates, '#ff3838', 0.3)
+                 for coordinates in self.get_notam_areas(launch_id, simplified=True)]
         
-        notam_records = cursor.fetchall()
+        # Custom NOTAM if present
+        if 'custom_notam' in self.selected_launch:
+            areas.append((self.selected_launch['custom_notam'], '#ffdd00', 0.4))
         
-        # Parse and draw each NOTAM
-        for record in notam_records:
-            notam_text = record[1] if len(record) > 1 else record[0]
-            coordinates = NotamParser.parse_notam_area(notam_text)
-            
-            if coordinates:
-                self.draw_notam_polygon(coordinates, launch_lat, launch_lon)
+        self.draw_notam_polygons(areas, launch_lat, launch_lon)
+    
+    def draw_notam_polygons(self, areas, launch_lat, launch_lon):
+        """
+        Draw NOTAM danger areas as a single PolyCollection, plus the path from the
+        launch site to each area
         
-        # Draw custom NOTAM if present
-        if 'custom_notam' in self.selected_launch:
-            coordinates = self.selected_launch['custom_notam']
-            self.draw_notam_polygon(coordinates, launch_lat, launch_lon, 
-                                   color='#ffdd00', alpha=0.4)
-    
-    def draw_notam_polygon(self, coordinates, launch_lat, launch_lon, 
-                          color='#ff3838', alpha=0.3):
-        """Draw a NOTAM danger area polygon and path from launch site"""
-        if not coordinates:
+        areas: [(coordinates, color, alpha), ...]
+        """
+        if not areas:
             return
         
-        # Extract lat/lon arrays
-        lats = [c[0] for c in coordinates]
-        lons = [c[1] for c in coordinates]
-        
-        # Close the polygon
-        if coordinates[0] != coordinates[-1]:
-            lats.append(lats[0])
-            lons.append(lons[0])
-        
-        # Draw polygon
-        polygon = MplPolygon(list(zip(lons, lats)), 
-                            facecolor=color, edgecolor=color, 
-                            alpha=alpha, linewidth=2,
-                            transform=ccrs.PlateCarree() if CARTOPY_AVAILABLE else None,
-                            zorder=5)
-        self.ax.add_patch(polygon)
-        self.notam_polygons.append(polygon)
-        
-        # Calculate center
-        center = NotamParser.calculate_polygon_center(coordinates)
-        if center and self.show_path_check.isChecked():
-            notam_lat, notam_lon = center
-            
-            # Draw great circle from launch to NOTAM center
-            self.draw_great_circle(self.ax, launch_lon, launch_lat, 
-                                  notam_lon, notam_lat, 
-                                  color=color, linewidth=2, alpha=0.8)
-            
-            # Calculate trajectory information
-            traj_info = self.calculate_great_circle_info(
-                launch_lat, launch_lon, notam_lat, notam_lon
-            )
-            
-            # Create info text box
-            info_text = (
-                f"Distance: {traj_info['distance_km']:.1f} km ({traj_info['distance_nm']:.1f} NM)\n"
-                f"Azimuth: {traj_info['azimuth']:.1f}°\n"
-                f"Inclination: {traj_info['inclination']:.1f}°"
-            )
-            
-            # Position the text box in the upper left corner of the map
-            # Use axes coordinates (0-1 range) so it stays in same place regardless of zoom
-            self.ax.text(0.02, 0.98, info_text,
-                        transform=self.ax.transAxes,  # Use axes coordinates, not data coordinates
-                        fontsize=10,
-                        color='white',
-                        verticalalignment='top',
-                        horizontalalignment='left',
-                        bbox=dict(boxstyle='round,pad=0.5',
-                                facecolor='#1a1a2e',
-                                edgecolor='#533483',
-                                alpha=0.9,
-                                linewidth=1.5),
-                        zorder=100)  # High zorder to appear on top
+        # Polygons are closed implicitly; colors carry their alpha per area
+        self._notam_verts = [np.asarray(coordinates, dtype=np.float64)[:, ::-1]
+                             for coordinates, _, _ in areas]
+        self._notam_colors = [to_rgba(color, alpha) for _, color, alpha in areas]
+        self._notam_coll.set_verts(self._notam_verts)
+        self._notam_coll.set_facecolors(self._notam_colors)
+        self._notam_coll.set_edgecolors(self._notam_colors)
+        
+        if not self.show_path_check.isChecked():
+            return
+        
+        # Trajectory information and paths to every NOTAM center, rounded to 1e-4° for caching
+        centers = np.round([NotamParser.calculate_polygon_center(coordinates)
+                            for coordinates, _, _ in areas], 4)
+        traj_info, segments = self.trajectory_paths(
+            round(launch_lat, 4), round(launch_lon, 4),
+            tuple(centers[:, 0].tolist()), tuple(centers[:, 1].tolist())
+        )
+        
+        # Great circles from launch to every NOTAM center
+        paths = self.draw_great_circles(self.ax, segments,
+                                        colors=[color for _, color, _ in areas])
+        self.notam_paths.append(self.add_overlay(paths))
+        
+        # A single info box is shown, so only the last area's path is formatted
+        self.draw_notam_info({key: values[-1] for key, values in traj_info.items()})
+    
+    def draw_notam_info(self, traj_info):
+        """Show the trajectory info box for a launch to NOTAM path"""
+        # Fill info text box
+        info_text = (
+            f"Distance: {traj_info['distance_km']:.1f} km ({traj_info['distance_nm']:.1f} NM)\n"
+            f"Azimuth: {traj_info['azimuth']:.1f}°\n"
+            f"Inclination: {traj_info['inclination']:.1f}°"
+        )
+        
+        self._traj_text.set_text(info_text)
+        self._traj_text.set_visible(True)
     
     def on_mouse_move(self, event):
         """Handle mouse movement for hover effects"""
@@ -849,30 +1105,44 @@ class MapView(QWidget):
         if mouse_lon is None or mouse_lat is None:
             return
         
-        # Check if hovering over a site marker
-        hover_found = False
-        for site_id, marker in self.site_markers.items():
-            marker_data = marker.get_data()
-            marker_lon = marker_data[0][0]
-            marker_lat = marker_data[1][0]
-            
-            # Check distance (approximately 3 degrees)
-            dist = np.sqrt((mouse_lon - marker_lon)**2 + (mouse_lat - marker_lat)**2)
-            
-            if dist < 3.0:
-                # Show label for this site
-                if site_id in self.site_labels:
-                    self.site_labels[site_id].set_visible(True)
-                    hover_found = True
-            else:
-                # Hide label (unless it's the selected launch)
-                if self.selected_launch and site_id == self.selected_launch.get('site_id'):
-                    continue  # Keep selected visible
-                if site_id in self.site_labels:
-                    self.site_labels[site_id].set_visible(False)
+        # Check if hovering over a site marker (approximately 3 degrees)
+        hovered = self.site_at(mouse_lon, mouse_lat, 3.0)
+        changed = False
+        
+        # Hide other labels; the selected site's label is part of the overlays
+        for site_id, label in self.site_labels.items():
+            if site_id != hovered and label.get_visible():
+                label.set_visible(False)
+                changed = True
+        
+        # Show label for the hovered site
+        if hovered is not None:
+            label = self.get_site_label(hovered)
+            if label is not None and not label.get_visible():
+                label.set_visible(True)
+                changed = True
+        
+        if changed:
+            self.blit_overlays()
+    
+    def schedule_redraw(self):
+        """Request a canvas redraw, collapsing rapid mouse events into one"""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start(30)
+    
+    def site_at(self, lon, lat, tolerance):
+        """Get the id of the nearest site marker within tolerance degrees, or None"""
+        if len(self._site_ids) == 0:
+            return None
         
-        if hover_found:
-            self.canvas.draw_idle()
+        if self._site_tree is not None:
+            # Misses come back as index len(sites)
+            _, i = self._site_tree.query([lon, lat], distance_upper_bound=tolerance)
+            return int(self._site_ids[i]) if i < len(self._site_ids) else None
+        
+        d2 = (self._site_lons - lon)**2 + (self._site_lats - lat)**2
+        i = int(np.argmin(d2))
+        return int(self._site_ids[i]) if d2[i] < tolerance**2 else None
     
     def on_mouse_scroll(self, event):
         """Handle mouse wheel scroll for zoom"""
@@ -912,7 +1182,7 @@ class MapView(QWidget):
             self.ax.set_xlim(x_center - new_x_range/2, x_center + new_x_range/2)
             self.ax.set_ylim(y_center - new_y_range/2, y_center + new_y_range/2)
         
-        self.canvas.draw_idle()
+        self.schedule_redraw()
     
     def on_mouse_click(self, event):
         """Handle mouse clicks on site markers"""
@@ -928,21 +1198,26 @@ class MapView(QWidget):
         if mouse_lon is None or mouse_lat is None:
             return
         
-        # Check if clicked on a site marker
-        for site_id, marker in self.site_markers.items():
-            marker_data = marker.get_data()
-            marker_lon = marker_data[0][0]
-            marker_lat = marker_data[1][0]
-            
-            # Check distance (approximately 2 degrees for click)
-            dist = np.sqrt((mouse_lon - marker_lon)**2 + (mouse_lat - marker_lat)**2)
-            
-            if dist < 2.0:
-                # Emit site_selected signal for main_window compatibility
-                self.site_selected.emit(site_id)
-                return
+        # Check if clicked on a site marker (approximately 2 degrees for click)
+        site_id = self.site_at(mouse_lon, mouse_lat, 2.0)
+        
+        if site_id is not None:
+            # Emit site_selected signal for main_window compatibility
+            self.site_selected.emit(site_id)
+    
+    def resizeEvent(self, event):
+        """Re-fit the map to the new canvas size"""
+        super().resizeEvent(event)
+        
+        # The basemap image was rendered for the old canvas size
+        self.show_basemap_image(False)
+        
+        # Use tight layout with minimal padding to maximize map area
+        self.figure.tight_layout(pad=0.1)
+        self.canvas.draw_idle()
     
     def refresh(self):
         """Refresh the map view"""
+        self._notam_cache.clear()
         self.update_map()
         self.populate_launch_combo()
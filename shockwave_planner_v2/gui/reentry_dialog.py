@@ -216,27 +216,12 @@ class ReentryDialog(QDialog):
     
     def load_reentry_data(self):
         """Load existing re-entry data for editing"""
-        # Get reentries - try multiple methods since we don't know which exists
-        reentries = []
         try:
-            # Try the most likely method names
-            if hasattr(self.db, 'get_all_reentries'):
-                reentries = self.db.get_all_reentries()
-            elif hasattr(self.db, 'get_reentries'):
-                reentries = self.db.get_reentries()
-            else:
-                # Fallback: search through all months to find our reentry
-                current_year = datetime.now().year
-                for year in range(current_year - 1, current_year + 2):
-                    for month in range(1, 13):
-                        month_reentries = self.db.get_reentries_by_month(year, month)
-                        reentries.extend(month_reentries)
+            reentry = self.db.get_reentry_by_id(self.reentry_id)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load re-entry data: {e}")
             return
         
-        reentry = next((r for r in reentries if r.get('reentry_id') == self.reentry_id), None)
-        
         if not reentry:
             QMessageBox.warning(self, "Error", "Re-entry not found.")
             return
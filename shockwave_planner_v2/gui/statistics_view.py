@@ -6,63 +6,135 @@ Author: Remix Astronautics
 Date: December 2025
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                              QFormLayout, QLabel, QTableWidget,
-                              QTableWidgetItem, QHeaderView, QComboBox,
+                              QFormLayout, QLabel, QTableView,
+                              QHeaderView, QComboBox,
                               QCheckBox, QSpinBox, QPushButton)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QSignalBlocker
 from datetime import datetime, timedelta
+from collections import defaultdict
+from functools import lru_cache
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 
+_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Yearly overview columns filled straight from get_yearly_statistics()
+_YEAR_COLUMNS = ('year', 'total', 'successful', 'failed', 'pending')
+_YEAR_HEADERS = ('Year', 'Total', 'Successful', 'Failed', 'Pending', 'Success Rate')
+
+
+class YearlyStatsModel(QAbstractTableModel):
+    """Read-only table model over the rows returned by get_yearly_statistics()"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_YEAR_HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _CENTER
+        if role == Qt.ItemDataRole.DisplayRole:
+            year_data = self._rows[index.row()]
+            if index.column() < len(_YEAR_COLUMNS):
+                return str(year_data[_YEAR_COLUMNS[index.column()]])
+            return f"{year_data['success_rate']:.1f}%"
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _YEAR_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+_MONTH_NUMBERS = list(range(1, 13))
+_MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Custom year colors - darkest to lightest (oldest to newest), by years ago
+_YEAR_COLORS = (
+    '#ff3838',  # Current year: RED (bright red like map)
+    '#ff9500',  # Previous year: ORANGE (bright orange like map)
+    '#ffb347',  # 2 years ago: LIGHTER ORANGE
+    '#ffdd00',  # 3 years ago: YELLOW (bright yellow like map)
+)
+_OLDER_YEAR_COLOR = '#808080'  # Older: Gray
+
+
+def _fill_combo(combo, labels, values):
+    """Replace a combo's items in one bulk insert, attaching values as item data"""
+    combo.clear()
+    combo.addItems(labels)
+    for index, value in enumerate(values):
+        if value is not None:
+            combo.setItemData(index, value)
+
+
 class StatisticsView(QWidget):
     """Statistics and analytics view for launch data"""
     
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
-        self.init_ui()
+        # Per-instance memo of chart series; cleared whenever data is reloaded
+        self._series_for = lru_cache(maxsize=64)(self._fetch_series)
+        self._build_widgets()
+        self._reload_data()
     
-    def init_ui(self):
-        """Initialize the user interface"""
+    def load_filter_options(self):
+        """Load the country/site/rocket dropdown data (rebuilt on refresh)"""
+        self._countries = [c for c in self.db.get_countries() if c]
+        
+        self._sites_by_country = defaultdict(list)
+        global_sites = {}  # location -> merged entry covering the pads of every country
+        for site in self.db.get_launch_sites_by_country():
+            if site['country']:
+                self._sites_by_country[site['country']].append(site)
+            merged = global_sites.get(site['location'])
+            if merged is None:
+                global_sites[site['location']] = dict(site)
+            else:
+                merged['site_ids'] = tuple(sorted(set(merged['site_ids']) | set(site['site_ids'])))
+        self._sites_by_country[None] = list(global_sites.values())
+        
+        self._rockets_by_country = defaultdict(list)
+        for rocket in self.db.get_rockets_by_country():
+            self._rockets_by_country[None].append(rocket)
+            if rocket['country']:
+                self._rockets_by_country[rocket['country']].append(rocket)
+    
+    def _build_widgets(self):
+        """Build the widgets once; data is filled in by _reload_data()"""
         layout = QVBoxLayout()
         
         # 5-Year Launch Overview (at the top)
-        yearly_stats = self.db.get_yearly_statistics(5)
-        
-        # Reverse the list so 2025 is at the top
-        yearly_stats.reverse()
-        
         overview_group = QGroupBox("Launch Statistics - Past 5 Years")
         overview_layout = QVBoxLayout()
         
         # Create table for yearly statistics
-        year_table = QTableWidget()
-        year_table.setRowCount(len(yearly_stats))
-        year_table.setColumnCount(6)
-        year_table.setHorizontalHeaderLabels([
-            'Year', 'Total', 'Successful', 'Failed', 'Pending', 'Success Rate'
-        ])
-        year_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        year_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        year_table.setMaximumHeight(200)
-        
-        for row, year_data in enumerate(yearly_stats):
-            # Center-aligned items
-            def create_centered_item(text):
-                item = QTableWidgetItem(str(text))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                return item
-            
-            year_table.setItem(row, 0, create_centered_item(year_data['year']))
-            year_table.setItem(row, 1, create_centered_item(year_data['total']))
-            year_table.setItem(row, 2, create_centered_item(year_data['successful']))
-            year_table.setItem(row, 3, create_centered_item(year_data['failed']))
-            year_table.setItem(row, 4, create_centered_item(year_data['pending']))
-            year_table.setItem(row, 5, create_centered_item(f"{year_data['success_rate']:.1f}%"))
-        
-        overview_layout.addWidget(year_table)
+        self.year_model = YearlyStatsModel(self)
+        self.year_table = QTableView()
+        self.year_table.setModel(self.year_model)
+        self.year_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.year_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.year_table.setMaximumHeight(200)
+        
+        overview_layout.addWidget(self.year_table)
         overview_group.setLayout(overview_layout)
         layout.addWidget(overview_group)
         
@@ -98,10 +170,9 @@ class StatisticsView(QWidget):
         month_names = ['January', 'February', 'March', 'April', 'May', 'June',
                       'July', 'August', 'September', 'October', 'November', 'December']
         current_month = datetime.now().month
-        for i, month in enumerate(month_names, 1):
-            self.month_selector.addItem(month, i)
+        _fill_combo(self.month_selector, month_names, range(1, 13))
         self.month_selector.setCurrentIndex(current_month - 1)  # Set to current month
-        self.month_selector.currentIndexChanged.connect(self.update_chart)
+        self.month_selector.currentIndexChanged.connect(self.schedule_chart_update)
         months_input_layout.addWidget(self.month_selector)
         months_input_layout.addStretch()
         x_axis_layout.addLayout(months_input_layout)
@@ -147,7 +218,7 @@ class StatisticsView(QWidget):
         self.entity_label = QLabel("Launch Site:")
         entity_layout.addWidget(self.entity_label)
         self.entity_combo = QComboBox()
-        self.entity_combo.currentIndexChanged.connect(self.update_chart)
+        self.entity_combo.currentIndexChanged.connect(self.schedule_chart_update)
         entity_layout.addWidget(self.entity_combo)
         y_axis_layout.addLayout(entity_layout)
         
@@ -161,15 +232,15 @@ class StatisticsView(QWidget):
         comparison_layout.addWidget(comparison_label)
         
         self.prev_year_1_check = QCheckBox("Include previous year")
-        self.prev_year_1_check.stateChanged.connect(self.update_chart)
+        self.prev_year_1_check.stateChanged.connect(self.schedule_chart_update)
         comparison_layout.addWidget(self.prev_year_1_check)
         
         self.prev_year_2_check = QCheckBox("Include past 2 years")
-        self.prev_year_2_check.stateChanged.connect(self.update_chart)
+        self.prev_year_2_check.stateChanged.connect(self.schedule_chart_update)
         comparison_layout.addWidget(self.prev_year_2_check)
         
         self.prev_year_3_check = QCheckBox("Include past 3 years")
-        self.prev_year_3_check.stateChanged.connect(self.update_chart)
+        self.prev_year_3_check.stateChanged.connect(self.schedule_chart_update)
         comparison_layout.addWidget(self.prev_year_3_check)
         
         comparison_layout.addStretch()
@@ -191,51 +262,79 @@ class StatisticsView(QWidget):
         self.canvas = FigureCanvas(self.figure)
         chart_layout.addWidget(self.canvas)
         
+        # Coalesce bursts of control changes into a single chart redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(50)
+        self._redraw_timer.timeout.connect(self.update_chart)
+        
+        # Persistent axes; one Line2D per year is reused across updates
+        self.ax = self.figure.add_subplot(111)
+        self._lines = {}
+        self._daily_axis = None
+        self._style_axes()
+        
         chart_group.setLayout(chart_layout)
         layout.addWidget(chart_group)
         
         layout.addStretch()
         self.setLayout(layout)
+    
+    def _reload_data(self):
+        """Re-query the database and repopulate the existing widgets"""
+        self._series_for.cache_clear()
+        self.load_filter_options()
+        self.populate_year_table()
+        
+        # Keep the current country selection if it still exists
+        country = self.country_combo.currentData()
+        with QSignalBlocker(self.country_combo):
+            self.populate_countries()
+            index = self.country_combo.findData(country)
+            self.country_combo.setCurrentIndex(max(index, 0))
         
-        # Initialize data
-        self.populate_countries()
         self.populate_entities()
         self.update_chart()
     
+    def populate_year_table(self):
+        """Populate the 5-year overview table"""
+        yearly_stats = self.db.get_yearly_statistics(5)
+        
+        # Reverse the list so the current year is at the top
+        yearly_stats.reverse()
+        
+        self.year_model.set_rows(yearly_stats)
+    
     def populate_countries(self):
         """Populate the country dropdown"""
-        countries = self.db.get_countries()
-        self.country_combo.clear()
-        self.country_combo.addItem("Global (All Countries)")
-        for country in countries:
-            if country:  # Only add non-empty country names
-                self.country_combo.addItem(country)
+        _fill_combo(self.country_combo,
+                    ["Global (All Countries)"] + self._countries,
+                    [None] + self._countries)
     
     def populate_entities(self):
         """Populate launch sites or rockets based on selected country and filter type"""
-        self.entity_combo.clear()
-        
-        country = self.country_combo.currentText()
-        if country == "Global (All Countries)":
-            country = None
+        country = self.country_combo.currentData()
         
         filter_type = self.filter_type_combo.currentText()
         
-        if filter_type == "Launch Sites":
-            entities = self.db.get_launch_sites_by_country(country)
-            self.entity_combo.addItem("All Sites")
-            for entity in entities:
-                self.entity_combo.addItem(entity)
-        else:  # Rockets
-            entities = self.db.get_rockets_by_country(country)
-            self.entity_combo.addItem("All Rockets")
-            for entity in entities:
-                self.entity_combo.addItem(entity)
+        # Callers redraw the chart themselves once the combo is repopulated
+        # Item data carries the integer filter key (site_ids / rocket_id)
+        with QSignalBlocker(self.entity_combo):
+            if filter_type == "Launch Sites":
+                entities = self._sites_by_country.get(country, [])
+                _fill_combo(self.entity_combo,
+                            ["All Sites"] + [entity['location'] for entity in entities],
+                            [None] + [entity['site_ids'] for entity in entities])
+            else:  # Rockets
+                entities = self._rockets_by_country.get(country, [])
+                _fill_combo(self.entity_combo,
+                            ["All Rockets"] + [entity['name'] for entity in entities],
+                            [None] + [entity['rocket_id'] for entity in entities])
     
     def on_country_changed(self):
         """Handle country selection change"""
         self.populate_entities()
-        self.update_chart()
+        self.schedule_chart_update()
     
     def on_filter_type_changed(self):
         """Handle filter type change (Sites/Rockets)"""
@@ -245,7 +344,7 @@ class StatisticsView(QWidget):
         else:
             self.entity_label.setText("Rocket:")
         self.populate_entities()
-        self.update_chart()
+        self.schedule_chart_update()
     
     def on_time_period_changed(self):
         """Handle time period selection change"""
@@ -261,23 +360,75 @@ class StatisticsView(QWidget):
             self.months_label.setVisible(False)
             self.month_range_label.setVisible(False)
         
-        self.update_chart()
+        self.schedule_chart_update()
+    
+    def schedule_chart_update(self):
+        """Request a chart redraw; repeated requests within 50 ms collapse into one"""
+        self._redraw_timer.start()
     
     def update_chart(self):
         """Update the chart with current selections"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        self._redraw_timer.stop()
+        # Hold canvas repaints while the figure is rebuilt, then schedule one draw
+        self.canvas.setUpdatesEnabled(False)
+        try:
+            self._plot_chart()
+        finally:
+            self.canvas.setUpdatesEnabled(True)
+        self.canvas.draw_idle()
+    
+    def _fetch_series(self, years, is_daily, selected_month, num_months,
+                      country, site_ids, rocket_id):
+        """Fetch every comparison year in a single query (memoized via _series_for)"""
+        if is_daily:
+            return self.db.get_launch_data_daily_by_month_by_year(
+                list(years), selected_month, num_months, country, site_ids, rocket_id
+            )
+        return self.db.get_launch_data_monthly_by_year(
+            list(years), country, site_ids, rocket_id
+        )
+    
+    def _style_axes(self):
+        """Apply the dark theme to the persistent axes (done once)"""
+        ax = self.ax
+        
+        # Dark theme chart styling
+        # Set dark background colors
+        self.figure.patch.set_facecolor('#0f0f1e')  # Dark background (like map)
+        ax.set_facecolor('#1a1a2e')  # Dark plot area (like map ocean)
+        
+        # No title - clean look (like map)
+        
+        # Axis labels in purple (matching tick colors and grid)
+        ax.set_xlabel('Time Period', fontsize=11, color='#533483')
+        ax.set_ylabel('Number of Launches', fontsize=11, color='#533483')
+        
+        # Grid in subtle purple (like map)
+        ax.grid(True, alpha=0.3, color='#533483', linewidth=0.5)
+        
+        # Tick colors in purple (like map coordinates)
+        ax.tick_params(colors='#533483', which='both')
+        
+        # Spine colors in purple
+        for spine in ax.spines.values():
+            spine.set_edgecolor('#533483')
+            spine.set_linewidth(1)
+        
+        # Set integer y-axis
+        ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
+    
+    def _plot_chart(self):
+        """Update the persistent year lines for the current selections"""
+        ax = self.ax
         
         # Get current selections
         time_period = self.time_period_combo.currentText()
-        country = self.country_combo.currentText()
-        if country == "Global (All Countries)":
-            country = None
+        country = self.country_combo.currentData()
         
         filter_type = self.filter_type_combo.currentText()
-        entity = self.entity_combo.currentText()
-        if entity.startswith("All "):
-            entity = None
+        entity = self.entity_combo.currentData()
+        site_ids = entity if filter_type == "Launch Sites" else None
+        rocket_id = entity if filter_type == "Rockets" else None
         
         # Get comparison years
         current_year = datetime.now().year
@@ -302,105 +453,72 @@ class StatisticsView(QWidget):
             num_months = 12
             is_daily = False
         
-        # Custom year colors - darkest to lightest (oldest to newest)
-        # Map years to colors based on age relative to current year
-        current_year = datetime.now().year
-        year_colors = {}
-        for year in years_to_plot:
-            years_ago = current_year - year
-            if years_ago == 0:
-                year_colors[year] = '#ff3838'  # Current year: RED (bright red like map)
-            elif years_ago == 1:
-                year_colors[year] = '#ff9500'  # Previous year: ORANGE (bright orange like map)
-            elif years_ago == 2:
-                year_colors[year] = '#ffb347'  # 2 years ago: LIGHTER ORANGE
-            elif years_ago == 3:
-                year_colors[year] = '#ffdd00'  # 3 years ago: YELLOW (bright yellow like map)
-            else:
-                year_colors[year] = '#808080'  # Older: Gray
+        series = self._series_for(tuple(years_to_plot), is_daily, selected_month,
+                                  num_months, country, site_ids, rocket_id)
+        
+        # Hide lines for years that are no longer selected
+        for year, line in self._lines.items():
+            if year not in years_to_plot:
+                line.set_visible(False)
         
-        for idx, year in enumerate(years_to_plot):
+        # Year-independent values are set up once, outside the per-year loop
+        if is_daily:
+            # Month range label follows the earliest plotted year
+            self.month_range_label.setText(f"({series[years_to_plot[0]][2]})")
+        else:
+            x_values = _MONTH_NUMBERS
+        
+        for year in years_to_plot:
             if is_daily:
-                # Daily data - pass the selected month
-                dates, counts, date_range = self.db.get_launch_data_daily_by_month(
-                    year, selected_month, num_months, country, 
-                    entity if filter_type == "Launch Sites" else None,
-                    entity if filter_type == "Rockets" else None
-                )
-                
-                # Plot with fewer labels on X-axis (show only day numbers)
-                ax.plot(range(len(dates)), counts, marker='o', markersize=3, 
-                       label=str(year), color=year_colors[year], linewidth=2)
-                
-                # Set X-axis to show only day numbers, reduced frequency
-                num_ticks = min(len(dates), 15)  # Show max 15 labels
-                tick_indices = [i * len(dates) // num_ticks for i in range(num_ticks)]
-                ax.set_xticks(tick_indices)
-                ax.set_xticklabels([dates[i] for i in tick_indices], rotation=0, fontsize=9)
-                
-                # Update the month range label
-                if idx == 0:  # Only update once
-                    self.month_range_label.setText(f"({date_range})")
+                # Daily data for the selected month range
+                dates, counts, _ = series[year]
+                x_values = list(range(len(dates)))
             else:
                 # Monthly data
-                months, counts = self.db.get_launch_data_monthly(
-                    year, country,
-                    entity if filter_type == "Launch Sites" else None,
-                    entity if filter_type == "Rockets" else None
-                )
-                month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                ax.plot(months, counts, marker='o', markersize=5,
-                       label=str(year), color=year_colors[year], linewidth=2)
-                ax.set_xticks(range(1, 13))
-                ax.set_xticklabels(month_labels)
-        
-        # Dark theme chart styling
-        # Set dark background colors
-        self.figure.patch.set_facecolor('#0f0f1e')  # Dark background (like map)
-        ax.set_facecolor('#1a1a2e')  # Dark plot area (like map ocean)
-        
-        # No title - clean look (like map)
-        
-        # Axis labels in purple (matching tick colors and grid)
-        ax.set_xlabel('Time Period', fontsize=11, color='#533483')
-        ax.set_ylabel('Number of Launches', fontsize=11, color='#533483')
+                counts = series[year]
+            
+            line = self._lines.get(year)
+            if line is None:
+                # Line style is fixed at creation; color reflects the year's age
+                years_ago = current_year - year
+                color = _YEAR_COLORS[years_ago] if years_ago < len(_YEAR_COLORS) else _OLDER_YEAR_COLOR
+                line, = ax.plot([], [], marker='o', markersize=3 if is_daily else 5,
+                                label=str(year), color=color, linewidth=2)
+                self._lines[year] = line
+            line.set_data(x_values, counts)
+            line.set_visible(True)
+        
+        if is_daily != self._daily_axis:
+            # Granularity changed: restyle markers and re-fit the layout once
+            for line in self._lines.values():
+                line.set_markersize(3 if is_daily else 5)
+            self._daily_axis = is_daily
+            relayout = True
+        else:
+            relayout = False
+        
+        if is_daily:
+            # Set X-axis to show only day numbers, reduced frequency
+            num_ticks = min(len(dates), 15)  # Show max 15 labels
+            tick_indices = [i * len(dates) // num_ticks for i in range(num_ticks)]
+            ax.set_xticks(tick_indices)
+            ax.set_xticklabels([dates[i] for i in tick_indices], rotation=0, fontsize=9)
+        else:
+            ax.set_xticks(_MONTH_NUMBERS)
+            ax.set_xticklabels(_MONTH_LABELS)
         
-        # Legend with dark theme
-        legend = ax.legend(loc='best', facecolor='#1a1a2e', edgecolor='#533483', 
-                          framealpha=0.9, labelcolor='white')
+        # Legend with dark theme (visible years only)
+        legend = ax.legend(handles=[self._lines[year] for year in years_to_plot],
+                           loc='best', facecolor='#1a1a2e', edgecolor='#533483', 
+                           framealpha=0.9, labelcolor='white')
         legend.get_frame().set_linewidth(1.5)
         
-        # Grid in subtle purple (like map)
-        ax.grid(True, alpha=0.3, color='#533483', linewidth=0.5)
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
         
-        # Tick colors in purple (like map coordinates)
-        ax.tick_params(colors='#533483', which='both')
-        
-        # Spine colors in purple
-        for spine in ax.spines.values():
-            spine.set_edgecolor('#533483')
-            spine.set_linewidth(1)
-        
-        # Set integer y-axis
-        ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        if relayout:
+            self.figure.tight_layout()
     
     def refresh(self):
-        """Refresh the statistics display"""
-        # Delete the old layout properly
-        old_layout = self.layout()
-        if old_layout:
-            # Remove all widgets from layout
-            while old_layout.count():
-                child = old_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            # Delete the layout itself
-            QWidget().setLayout(old_layout)
-        
-        # Rebuild the UI with fresh data
-        self.init_ui()
+        """Refresh the statistics display in place"""
+        self._reload_data()
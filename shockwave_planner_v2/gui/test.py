@@ -5,9 +5,6 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QMessageBox, QProgressDialog, QTableWidget, QTableWidgetItem)
 from PyQt6.QtCore import Qt, QDate, QTime, QThread, pyqtSignal
 from PyQt6.QtGui import QAction, QFont
-from datetime import datetime
-import sys
-import os
 import sys
 import os
 from PyQt6.QtWidgets import QApplication, QSplashScreen
@@ -128,17 +125,14 @@ class LaunchEditorDialog(QDialog):
     
     def load_launch_data(self):
         """Load existing launch data"""
-        launches = self.db.get_launches_by_date_range('1900-01-01', '2100-01-01')
-        launch = next((l for l in launches if l['launch_id'] == self.launch_id), None)
+        launch = self.db.get_launch_by_id(self.launch_id)
         
         if launch:
             if launch['launch_date']:
-                date_obj = datetime.strptime(launch['launch_date'], '%Y-%m-%d')
-                self.date_edit.setDate(QDate(date_obj.year, date_obj.month, date_obj.day))
+                self.date_edit.setDate(QDate.fromString(launch['launch_date'], 'yyyy-MM-dd'))
             
             if launch['launch_time']:
-                time_obj = datetime.strptime(launch['launch_time'], '%H:%M:%S').time()
-                self.time_edit.setTime(QTime(time_obj.hour, time_obj.minute, time_obj.second))
+                self.time_edit.setTime(QTime.fromString(launch['launch_time'], 'HH:mm:ss'))
             
             if launch['site_id']:
                 index = self.site_combo.findData(launch['site_id'])
@@ -158,17 +152,9 @@ class LaunchEditorDialog(QDialog):
             self.mission_edit.setText(launch.get('mission_name') or '')
             self.payload_edit.setText(launch.get('payload_name') or '')
             
-            notam_data = self.db.conn.cursor().execute("""
-                                                        SELECT ln.serial 
-                                                        FROM launch_notam AS ln 
-                                                        WHERE ln.launch_id == ?;
-                                                       """, 
-                                                       (str(launch['launch_id']),)
-                                                       )
-            notam_data = [dict(row) for row in notam_data.fetchall()]
-            for col in range(len(notam_data)):
-                serial = notam_data[col]["serial"]
-                self.notam_edit.setItem(0, col, QTableWidgetItem(serial))
+            if launch['notam_serials']:
+                for col, serial in enumerate(launch['notam_serials'].split('|')):
+                    self.notam_edit.setItem(0, col, QTableWidgetItem(serial))
 
             if launch.get('orbit_type'):
                 index = self.orbit_combo.findText(launch['orbit_type'])
@@ -377,17 +363,14 @@ class LaunchEditorDialog(QDialog):
         }
 
         # NOTAM data
-        notam_data = [self.notam_edit.item(0, col).data(0) for col in range(self.notam_edit.columnCount())]
+        notam_data = [item.text().strip() for item in
+                      (self.notam_edit.item(0, col) for col in range(self.notam_edit.columnCount()))
+                      if item is not None]
         
         try:
             if self.launch_id:
                 self.db.update_launch(self.launch_id, launch_data)
-                self.db.conn.cursor().execute("""
-                                                UPDATE launch_notam  
-                                            """
-                                             )
-
-                                            
+                self.db.set_launch_notams(self.launch_id, [s for s in notam_data if s])
                 
                 QMessageBox.information(self, "Success", "Launch updated successfully!")
             else:
@@ -400,16 +383,16 @@ class LaunchEditorDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to save launch: {e}")
 
 
-QApplication.setHighDpiScaleFactorRoundingPolicy(
-
+if __name__ == '__main__':
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
- 
-app = QApplication(sys.argv)
-window = QMainWindow()
-
-db = LaunchDatabase()
-
-test = LaunchEditorDialog(db, launch_id=1)
-test.show()
-sys.exit(app.exec())
\ No newline at end of file
+    
+    app = QApplication(sys.argv)
+    window = QMainWindow()
+    
+    db = LaunchDatabase()
+    
+    test = LaunchEditorDialog(db, launch_id=1)
+    test.show()
+    sys.exit(app.exec())
@@ -2,19 +2,294 @@
 SHOCKWAVE PLANNER v1.1 - Timeline View
 Gantt-chart style launch timeline with grouped launch sites
 """
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                              QTableWidgetItem, QPushButton, QLabel, QHeaderView,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                              QPushButton, QLabel, QHeaderView,
                               QCheckBox, QSpinBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtSlot, QAbstractTableModel, QModelIndex,
+                          QObject, QThread, QMetaObject, QCoreApplication, QTimer)
 from PyQt6.QtGui import QColor, QFont
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
 import calendar
+import heapq
+
+from data.database import LaunchDatabase
+
+
+@lru_cache(maxsize=32)
+def month_meta(year, month):
+    """Return (days in month, month name), cached across month navigation"""
+    return calendar.monthrange(year, month)[1], calendar.month_name[month]
+
+
+def previous_month_of(year, month):
+    """Return (year, month) for the month before the given one"""
+    if month == 1:
+        return year - 1, 12
+    return year, month - 1
+
+
+def day_of_month(date_str):
+    """Day from a stored 'YYYY-MM-DD' date, sliced rather than parsed with strptime"""
+    return int(date_str[8:10])
+
+
+def group_month_timeline(rows, year, month):
+    """
+    Fold ordered iter_month_timeline rows into {country: [site dict, ...]} in one pass
+    
+    Each site dict carries its launches for the month and the previous month's
+    launches (for turnaround carry-over).
+    """
+    month_start = f"{year:04d}-{month:02d}-01"
+    country_sites = {}
+    site = None
+    for row in rows:
+        if site is None or site['site_id'] != row['site_id']:
+            site = {
+                'type': 'site',
+                'country': row['country'],
+                'location': row['location'],
+                'pad': row['launch_pad'],
+                'site_id': row['site_id'],
+                'turnaround_days': row['turnaround_days'],
+                'launches': [],
+                'prev_month_launches': []
+            }
+            country_sites.setdefault(row['country'], []).append(site)
+        if row['launch_id'] is not None:
+            if row['launch_date'] >= month_start:
+                site['launches'].append(row)
+            else:
+                site['prev_month_launches'].append(row)
+    return country_sites
+
+
+class TimelineLoader(QObject):
+    """Loads a month's timeline on a worker thread with its own database connection"""
+    
+    loaded = pyqtSignal(int, int, int, object)  # year, month, generation, {country: [site, ...]}
+    
+    def __init__(self, db_path):
+        super().__init__()
+        self.db_path = db_path
+        self._db = None
+    
+    @pyqtSlot(int, int, int)
+    def load(self, year, month, generation):
+        # SQLite connections are bound to the thread that opened them
+        if self._db is None:
+            self._db = LaunchDatabase(self.db_path)
+        
+        # Sites joined to this and the previous month's launches, grouped as rows stream in
+        rows = self._db.iter_month_timeline(year, month)
+        self.loaded.emit(year, month, generation, group_month_timeline(rows, year, month))
+    
+    @pyqtSlot()
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class TimelineModel(QAbstractTableModel):
+    """
+    Table model for the launch Gantt grid
+    
+    Rows are the prepared group/site dicts from TimelineView.update_timeline.
+    Per-site day cells are precomputed once in set_rows(); data() only looks
+    them up, so Qt materializes cells lazily as they are painted.
+    """
+    
+    GROUP_BACKGROUND = QColor(67, 25, 218)
+    GROUP_FOREGROUND = QColor(Qt.GlobalColor.white)
+    SITE_BACKGROUND = QColor(240, 240, 245)
+    SITE_FOREGROUND = QColor(Qt.GlobalColor.black)
+    TURNAROUND_BACKGROUND = QColor(200, 200, 200)
+    EMPTY_BACKGROUND = QColor(255, 255, 255)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._days_in_month = 0
+        self._days_in_prev_month = 0
+        self._default_turnaround = 0
+        self._headers = []
+        self._status_colors = {}  # Status hex string -> shared QColor
+        self._group_font = QFont()
+        self._group_font.setBold(True)
+        self._group_font.setPointSize(10)
+    
+    def set_rows(self, rows, days_in_month, days_in_prev_month, default_turnaround):
+        """Replace the grid contents with a single model reset"""
+        self.beginResetModel()
+        
+        self._days_in_prev_month = days_in_prev_month
+        self._default_turnaround = default_turnaround
+        for row_data in rows:
+            if row_data['type'] == 'group':
+                self._prepare_group(row_data)
+            else:
+                self._prepare_site(row_data)
+        
+        self._rows = rows
+        self._days_in_month = days_in_month
+        self._headers = ['LOCATION', 'LAUNCH PAD', 'ROCKET'] + [
+            str(day) for day in range(1, days_in_month + 1)]
+        
+        self.endResetModel()
+    
+    def expand_group(self, row, sites):
+        """Insert a group's site rows below its header without resetting the model"""
+        for row_data in sites:
+            if 'cells' not in row_data:
+                self._prepare_site(row_data)
+        
+        if sites:
+            self.beginInsertRows(QModelIndex(), row + 1, row + len(sites))
+            self._rows[row + 1:row + 1] = sites
+            self.endInsertRows()
+        self._set_expanded(row, True)
+    
+    def collapse_group(self, row, count):
+        """Remove the count site rows below a group header"""
+        if count:
+            self.beginRemoveRows(QModelIndex(), row + 1, row + count)
+            del self._rows[row + 1:row + 1 + count]
+            self.endRemoveRows()
+        self._set_expanded(row, False)
+    
+    def _set_expanded(self, row, expanded):
+        row_data = self._rows[row]
+        row_data['expanded'] = expanded
+        self._prepare_group(row_data)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+    
+    def _prepare_group(self, row_data):
+        expand_icon = "▼" if row_data['expanded'] else "▶"
+        row_data['label'] = f"{expand_icon} {row_data['country']}"
+        row_data['payload'] = {'type': 'group', 'country': row_data['country']}
+    
+    def _status_color(self, hex_color):
+        hex_color = hex_color or '#FFFF00'
+        color = self._status_colors.get(hex_color)
+        if color is None:
+            color = self._status_colors[hex_color] = QColor(hex_color)
+        return color
+    
+    def _prepare_site(self, row_data):
+        # Show turnaround days in pad name
+        site_turnaround = row_data.get('turnaround_days')
+        if site_turnaround is None:
+            site_turnaround = self._default_turnaround
+        rockets = {launch['rocket_name'] for launch in row_data['launches']
+                   if launch.get('rocket_name')}
+        row_data['texts'] = (row_data['location'],
+                             f"{row_data['pad']} ({site_turnaround}d)",
+                             ", ".join(heapq.nsmallest(2, rockets)))
+        
+        # Index launches by day of month once
+        by_day = {}
+        for launch in row_data['launches']:
+            by_day.setdefault(day_of_month(launch['launch_date']), []).append(launch)
+        
+        cells = {}
+        for day, day_launches in by_day.items():
+            launch = day_launches[0]
+            cells[day] = (str(len(day_launches)),
+                          self._status_color(launch.get('status_color')),
+                          {'type': 'launch',
+                           'launch_id': launch['launch_id'],
+                           'count': len(day_launches)})
+        row_data['cells'] = cells
+        
+        # Days inside a turnaround period, using site-specific turnaround
+        turnaround_set = set()
+        for launch_day in by_day:
+            turnaround_set.update(range(launch_day + 1, launch_day + site_turnaround + 1))
+        
+        # Launches from previous month whose turnaround extends into this month
+        for prev_launch in row_data.get('prev_month_launches', []):
+            prev_launch_day = day_of_month(prev_launch['launch_date'])
+            days_past_month_end = (prev_launch_day + site_turnaround) - self._days_in_prev_month
+            if days_past_month_end > 0:
+                turnaround_set.update(range(1, days_past_month_end + 1))
+        row_data['turnaround_set'] = turnaround_set
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3 + self._days_in_month
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row_data = self._rows[index.row()]
+        col = index.column()
+        
+        if row_data['type'] == 'group':
+            if col != 0:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return row_data['label']
+            if role == Qt.ItemDataRole.FontRole:
+                return self._group_font
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self.GROUP_BACKGROUND
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.GROUP_FOREGROUND
+            if role == Qt.ItemDataRole.UserRole:
+                return row_data['payload']
+            return None
+        
+        if col < 3:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return row_data['texts'][col]
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self.SITE_BACKGROUND
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.SITE_FOREGROUND
+            return None
+        
+        day = col - 2
+        cell = row_data['cells'].get(day)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cell[0] if cell else ""
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if cell:
+                return cell[1]
+            if day in row_data['turnaround_set']:
+                return self.TURNAROUND_BACKGROUND
+            return self.EMPTY_BACKGROUND
+        if role == Qt.ItemDataRole.UserRole:
+            return cell[2] if cell else None
+        return None
+
+
+MONTH_CACHE_SIZE = 5
+
+
+def next_month_of(year, month):
+    """Return (year, month) for the month after the given one"""
+    if month == 12:
+        return year + 1, 1
+    return year, month + 1
 
 
 class TimelineView(QWidget):
     """Gantt-chart style timeline showing launches across a month"""
     
     launch_selected = pyqtSignal(int)
+    load_requested = pyqtSignal(int, int, int)  # year, month, generation
     
     def __init__(self, db):
         super().__init__()
@@ -25,6 +300,31 @@ class TimelineView(QWidget):
         self.pad_turnaround_days = 7
         self.expanded_groups = set()  # Track which countries are expanded
         self.initial_load = True  # Track if this is the first load
+        self._month_sites = None  # group_month_timeline result for the shown month
+        self._country_sites = {}  # Site rows currently shown under each expanded country
+        # Month the grid was last rendered from; stays valid while the next month loads
+        self._rendered_sites = {}
+        # LRU of loaded months (incl. prefetched neighbours) and months being loaded
+        self._month_cache = OrderedDict()
+        self._pending_months = set()
+        # Bumped by refresh() so results of requests made before an edit are discarded
+        self._generation = 0
+        
+        # Coalesce rapid month navigation so only the month the user stops on is queried
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(150)
+        self._load_timer.timeout.connect(self._load_current_month)
+        
+        # Month queries run on a background thread; results come back via loaded
+        self._loader_thread = QThread(self)
+        self._loader = TimelineLoader(db.db_path)
+        self._loader.moveToThread(self._loader_thread)
+        self.load_requested.connect(self._loader.load)
+        self._loader.loaded.connect(self._on_month_loaded)
+        self._loader_thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_loader)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -33,10 +333,14 @@ class TimelineView(QWidget):
         controls = self.create_controls()
         layout.addLayout(controls)
         
-        self.timeline_table = QTableWidget()
+        self.timeline_model = TimelineModel(self)
+        self.timeline_table = QTableView()
+        self.timeline_table.setModel(self.timeline_model)
         self.timeline_table.verticalHeader().setVisible(True)
+        self.timeline_table.verticalHeader().setDefaultSectionSize(30)
+        self.timeline_table.horizontalHeader().setDefaultSectionSize(30)
         self.timeline_table.setShowGrid(True)
-        self.timeline_table.cellClicked.connect(self.cell_clicked)
+        self.timeline_table.clicked.connect(self.cell_clicked)
         
         layout.addWidget(self.timeline_table)
         self.setLayout(layout)
@@ -72,212 +376,136 @@ class TimelineView(QWidget):
         return layout
     
     def update_timeline(self):
-        month_name = calendar.month_name[self.current_month]
+        """Show the current month and request its launches from the loader thread"""
+        month_name = month_meta(self.current_year, self.current_month)[1]
         self.month_label.setText(f"{month_name} {self.current_year}")
         
-        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
-        launches = self.db.get_launches_by_month(self.current_year, self.current_month)
-        
-        # Also get launches from the end of previous month for turnaround carry-over
-        prev_year = self.current_year
-        prev_month = self.current_month - 1
-        if prev_month < 1:
-            prev_month = 12
-            prev_year -= 1
-        prev_month_launches = self.db.get_launches_by_month(prev_year, prev_month)
-        
-        # Group launches by site
-        site_launches = {}
-        site_prev_launches = {}  # Track previous month launches for turnaround
-        
-        for launch in launches:
-            key = (launch.get('location', ''), launch.get('launch_pad', ''))
-            if key not in site_launches:
-                site_launches[key] = []
-            site_launches[key].append(launch)
-        
-        for launch in prev_month_launches:
-            key = (launch.get('location', ''), launch.get('launch_pad', ''))
-            if key not in site_prev_launches:
-                site_prev_launches[key] = []
-            site_prev_launches[key].append(launch)
-        
-        # Get all sites and group by country
-        all_sites = self.db.get_all_sites(site_type='LAUNCH')
-        country_sites_map = {}
-        
-        for site in all_sites:
-            country = site.get('country', 'Other')
-            if not country or country == '':
-                country = 'Other'
-            
-            if country not in country_sites_map:
-                country_sites_map[country] = []
-            
-            site_key = (site['location'], site['launch_pad'])
-            has_launches = site_key in site_launches
-            
-            if has_launches or not self.show_only_active:
-                country_sites_map[country].append({
-                    'type': 'site',
-                    'country': country,
-                    'location': site['location'],
-                    'pad': site['launch_pad'],
-                    'site_id': site['site_id'],
-                    'turnaround_days': site.get('turnaround_days', self.pad_turnaround_days),
-                    'launches': site_launches.get(site_key, []),
-                    'prev_month_launches': site_prev_launches.get(site_key, [])  # For turnaround carry-over
-                })
+        key = (self.current_year, self.current_month)
+        if key in self._month_cache:
+            self._month_cache.move_to_end(key)
+            self._month_sites = self._month_cache[key]
+            self._render()
+            self._prefetch_neighbours()
+        else:
+            self._month_sites = None
+            self._load_timer.start()
+    
+    def _load_current_month(self):
+        self._request_month(self.current_year, self.current_month)
+    
+    def _request_month(self, year, month):
+        if (year, month) not in self._pending_months:
+            self._pending_months.add((year, month))
+            self.load_requested.emit(year, month, self._generation)
+    
+    def _prefetch_neighbours(self):
+        """Queue the months either side of the current one so navigation hits the cache"""
+        current = (self.current_year, self.current_month)
+        for key in (previous_month_of(*current), next_month_of(*current)):
+            if key not in self._month_cache:
+                self._request_month(*key)
+    
+    def _on_month_loaded(self, year, month, generation, country_sites):
+        # Loaded before the last refresh(), so it may predate an edit
+        if generation != self._generation:
+            return
+        
+        key = (year, month)
+        self._pending_months.discard(key)
+        self._month_cache[key] = country_sites
+        self._month_cache.move_to_end(key)
+        while len(self._month_cache) > MONTH_CACHE_SIZE:
+            self._month_cache.popitem(last=False)
+        
+        # Prefetched or stale months are only cached, not rendered
+        if key != (self.current_year, self.current_month):
+            return
+        self._month_sites = self._month_cache[key]
+        self._render()
+        self._prefetch_neighbours()
+    
+    def _stop_loader(self):
+        QMetaObject.invokeMethod(self._loader, "close",
+                                 Qt.ConnectionType.BlockingQueuedConnection)
+        self._loader_thread.quit()
+        self._loader_thread.wait()
+    
+    def _render(self):
+        """Rebuild the grid from the loaded month without querying launches"""
+        if self._month_sites is None:
+            return
+        
+        days_in_month = month_meta(self.current_year, self.current_month)[0]
+        prev_year, prev_month = previous_month_of(self.current_year, self.current_month)
+        days_in_prev_month = month_meta(prev_year, prev_month)[0]
         
         # Build rows for display
+        self._rendered_sites = self._month_sites
+        self._country_sites = {}
         rows = []
-        for country in sorted(country_sites_map.keys()):
-            sites = country_sites_map[country]
-            country_has_launches = any(s['launches'] for s in sites)
+        for country in sorted(self._month_sites.keys()):
+            country_has_launches = any(site['launches'] for site in self._month_sites[country])
             
             # FIXED: Only auto-expand countries with launches on initial load
             if self.initial_load and country_has_launches:
                 self.expanded_groups.add(country)
             
-            if sites and (country_has_launches or not self.show_only_active):
+            if country_has_launches or not self.show_only_active:
                 rows.append({
                     'type': 'group',
                     'country': country,
                     'expanded': country in self.expanded_groups
                 })
                 
+                # Collapsed groups get their site rows only when expanded
                 if country in self.expanded_groups:
-                    rows.extend(sites)
+                    rows.extend(self._visible_sites(country))
         
         # Mark that initial load is complete
         self.initial_load = False
         
-        self.timeline_table.setRowCount(len(rows))
-        self.timeline_table.setColumnCount(3 + days_in_month)
+        # Suppress per-cell repaints and signals while the grid is rebuilt
+        table = self.timeline_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            self._populate_table(rows, days_in_month, days_in_prev_month)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+    
+    def _visible_sites(self, country):
+        """Site rows shown under an expanded country, kept so a collapse can remove them"""
+        sites = [site for site in self._rendered_sites.get(country, [])
+                 if site['launches'] or not self.show_only_active]
+        self._country_sites[country] = sites
+        return sites
+    
+    def _populate_table(self, rows, days_in_month, days_in_prev_month):
+        """Load the prepared group/site rows into the model and lay out the grid"""
+        self.timeline_model.set_rows(rows, days_in_month, days_in_prev_month,
+                                     self.pad_turnaround_days)
         
-        # Clear all spans from previous render
+        # Group rows span the full width
         self.timeline_table.clearSpans()
-        
-        headers = ['LOCATION', 'LAUNCH PAD', 'ROCKET']
-        for day in range(1, days_in_month + 1):
-            headers.append(str(day))
-        self.timeline_table.setHorizontalHeaderLabels(headers)
-        
-        self.timeline_table.setColumnWidth(0, 120)
-        self.timeline_table.setColumnWidth(1, 120)
-        self.timeline_table.setColumnWidth(2, 150)
-        
-        for col in range(3, 3 + days_in_month):
-            self.timeline_table.setColumnWidth(col, 30)
-        
         for row_idx, row_data in enumerate(rows):
             if row_data['type'] == 'group':
-                country = row_data['country']
-                expanded = row_data['expanded']
-                
-                expand_icon = "▼" if expanded else "▶"
-                item = QTableWidgetItem(f"{expand_icon} {country}")
-                font = item.font()
-                font.setBold(True)
-                font.setPointSize(10)
-                item.setFont(font)
-                item.setBackground(QColor(67, 25, 218))
-                item.setForeground(Qt.GlobalColor.white) 
-                item.setData(Qt.ItemDataRole.UserRole, {'type': 'group', 'country': country})
-                
-                self.timeline_table.setItem(row_idx, 0, item)
                 self.timeline_table.setSpan(row_idx, 0, 1, 3 + days_in_month)
-                
-            else:
-                location_item = QTableWidgetItem(row_data['location'])
-                location_item.setBackground(QColor(240, 240, 245))
-                self.timeline_table.setItem(row_idx, 0, location_item)
-                location_item.setForeground(Qt.GlobalColor.black)
-                
-                # Show turnaround days in pad name
-                turnaround = row_data.get('turnaround_days', self.pad_turnaround_days)
-                pad_text = f"{row_data['pad']} ({turnaround}d)"
-                pad_item = QTableWidgetItem(pad_text)
-                pad_item.setBackground(QColor(240, 240, 245))
-                self.timeline_table.setItem(row_idx, 1, pad_item)
-                pad_item.setForeground(Qt.GlobalColor.black)
-                
-                rockets = set()
-                for launch in row_data['launches']:
-                    if launch.get('rocket_name'):
-                        rockets.add(launch['rocket_name'])
-                
-                rocket_item = QTableWidgetItem(", ".join(sorted(rockets)[:2]))
-                rocket_item.setBackground(QColor(240, 240, 245))
-                self.timeline_table.setItem(row_idx, 2, rocket_item)
-                rocket_item.setForeground(Qt.GlobalColor.black)
-                
-                for col_day in range(1, days_in_month + 1):
-                    col_idx = 2 + col_day
-                    item = QTableWidgetItem("")
-                    
-                    day_launches = [l for l in row_data['launches'] 
-                                   if datetime.strptime(l['launch_date'], '%Y-%m-%d').day == col_day]
-                    
-                    if day_launches:
-                        launch = day_launches[0]
-                        status_color = launch.get('status_color', '#FFFF00')
-                        item.setBackground(QColor(status_color))
-                        item.setText(str(len(day_launches)))
-                        item.setData(Qt.ItemDataRole.UserRole, {
-                            'type': 'launch',
-                            'launch_id': launch['launch_id'],
-                            'count': len(day_launches)
-                        })
-                    else:
-                        # Check for turnaround period using site-specific turnaround
-                        in_turnaround = False
-                        site_turnaround = row_data.get('turnaround_days', self.pad_turnaround_days)
-                        
-                        # Check launches in current month
-                        for launch in row_data['launches']:
-                            launch_day = datetime.strptime(launch['launch_date'], '%Y-%m-%d').day
-                            if launch_day < col_day <= launch_day + site_turnaround:
-                                in_turnaround = True
-                                break
-                        
-                        # Check launches from previous month that might extend into current month
-                        if not in_turnaround and row_data.get('prev_month_launches'):
-                            prev_year = self.current_year
-                            prev_month = self.current_month - 1
-                            if prev_month < 1:
-                                prev_month = 12
-                                prev_year -= 1
-                            
-                            days_in_prev_month = calendar.monthrange(prev_year, prev_month)[1]
-                            
-                            for prev_launch in row_data['prev_month_launches']:
-                                prev_launch_date = datetime.strptime(prev_launch['launch_date'], '%Y-%m-%d')
-                                prev_launch_day = prev_launch_date.day
-                                
-                                # Calculate how many days into current month the turnaround extends
-                                days_past_month_end = (prev_launch_day + site_turnaround) - days_in_prev_month
-                                
-                                if days_past_month_end > 0 and col_day <= days_past_month_end:
-                                    in_turnaround = True
-                                    break
-                        
-                        if in_turnaround:
-                            item.setBackground(QColor(200, 200, 200))
-                        else:
-                            item.setBackground(QColor(255, 255, 255))
-                    
-                    self.timeline_table.setItem(row_idx, col_idx, item)
-        
-        for row in range(len(rows)):
-            self.timeline_table.setRowHeight(row, 30)
-    
-    def cell_clicked(self, row: int, col: int):
-        item = self.timeline_table.item(row, col)
-        if not item:
-            return
         
-        data = item.data(Qt.ItemDataRole.UserRole)
+        self.timeline_table.setColumnWidth(0, 120)
+        self.timeline_table.setColumnWidth(1, 120)
+        self.timeline_table.setColumnWidth(2, 150)
+    
+    def refresh(self):
+        """Reload site and launch data (e.g. after edits or turnaround updates) and redraw"""
+        self._generation += 1
+        self._month_cache.clear()
+        self._pending_months.clear()
+        self.update_timeline()
+    
+    def cell_clicked(self, index: QModelIndex):
+        data = index.data(Qt.ItemDataRole.UserRole)
         if not data:
             return
         
@@ -285,9 +513,11 @@ class TimelineView(QWidget):
             country = data['country']
             if country in self.expanded_groups:
                 self.expanded_groups.remove(country)
+                shown = self._country_sites.pop(country, [])
+                self.timeline_model.collapse_group(index.row(), len(shown))
             else:
                 self.expanded_groups.add(country)
-            self.update_timeline()
+                self.timeline_model.expand_group(index.row(), self._visible_sites(country))
         
         elif data.get('type') == 'launch':
             self.launch_selected.emit(data['launch_id'])
@@ -308,4 +538,4 @@ class TimelineView(QWidget):
     
     def toggle_active_only(self, state):
         self.show_only_active = (state == Qt.CheckState.Checked.value)
-        self.update_timeline()
+        self._render()
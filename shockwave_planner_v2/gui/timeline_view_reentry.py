@@ -11,10 +11,26 @@ Version: 2.0.0
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                               QTableWidgetItem, QPushButton, QLabel, QHeaderView,
                               QCheckBox, QSpinBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt6.QtGui import QColor, QFont
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 import calendar
+import heapq
+import numpy as np
+
+# Shared cell colours, reused instead of constructed per cell
+_WHITE = QColor(255, 255, 255)
+_RECOVERY = QColor(200, 200, 200)
+_HEADER_BG = QColor(240, 240, 245)
+_GROUP_BG = QColor(67, 25, 218)
+
+
+@lru_cache(maxsize=64)
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month, cached across renders"""
+    return calendar.monthrange(year, month)[1]
 
 
 class ReentryTimelineView(QWidget):
@@ -31,6 +47,9 @@ class ReentryTimelineView(QWidget):
         self.zone_turnaround_days = 7
         self.expanded_groups = set()  # Track which countries are expanded
         self.initial_load = True  # Track if this is the first load
+        self._rows = []
+        self._country_row_ranges = {}  # country -> range of its zone rows
+        self._status_color_cache = {}  # status colour string -> QColor
         self.init_ui()
     
     def init_ui(self):
@@ -78,37 +97,43 @@ class ReentryTimelineView(QWidget):
         return layout
     
     def update_timeline(self):
+        """Rebuild the table with repaints, signals and sorting suspended"""
+        table = self.timeline_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                self.populate_timeline()
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+    
+    def populate_timeline(self):
         month_name = calendar.month_name[self.current_month]
         self.month_label.setText(f"{month_name} {self.current_year} - Re-entry Operations")
         
-        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
-        
-        # Get re-entries for this month
-        reentries = self.db.get_reentries_by_month(self.current_year, self.current_month)
+        days_in_month = _days_in_month(self.current_year, self.current_month)
         
-        # Also get re-entries from the end of previous month for turnaround carry-over
         prev_year = self.current_year
         prev_month = self.current_month - 1
         if prev_month < 1:
             prev_month = 12
             prev_year -= 1
-        prev_month_reentries = self.db.get_reentries_by_month(prev_year, prev_month)
+        days_in_prev_month = _days_in_month(prev_year, prev_month)
+        
+        # Get re-entries for this month and the previous one (for turnaround carry-over)
+        reentries = self.db.get_reentry_timeline(self.current_year, self.current_month)
+        month_start = f"{self.current_year:04d}-{self.current_month:02d}-01"
         
         # Group re-entries by zone
-        zone_reentries = {}
-        zone_prev_reentries = {}  # Track previous month re-entries for turnaround
+        zone_reentries = defaultdict(list)
+        zone_prev_reentries = defaultdict(list)  # Track previous month re-entries for turnaround
         
         for reentry in reentries:
             key = (reentry.get('location', 'Unknown'), reentry.get('drop_zone', 'Unknown'))
-            if key not in zone_reentries:
-                zone_reentries[key] = []
-            zone_reentries[key].append(reentry)
-        
-        for reentry in prev_month_reentries:
-            key = (reentry.get('location', 'Unknown'), reentry.get('drop_zone', 'Unknown'))
-            if key not in zone_prev_reentries:
-                zone_prev_reentries[key] = []
-            zone_prev_reentries[key].append(reentry)
+            zones = zone_reentries if reentry['reentry_date'] >= month_start else zone_prev_reentries
+            zones[key].append(reentry)
         
         # Get all re-entry sites and group by country
         # FIXED: Use get_all_reentry_sites() instead of get_all_sites()
@@ -124,22 +149,26 @@ class ReentryTimelineView(QWidget):
                 country_zones_map[country] = []
             
             zone_key = (zone['location'], zone.get('drop_zone', 'Unknown'))
-            has_reentries = zone_key in zone_reentries
+            turnaround = zone.get('turnaround_days')
+            if turnaround is None:
+                turnaround = self.zone_turnaround_days
             
-            if has_reentries or not self.show_only_active:
-                country_zones_map[country].append({
-                    'type': 'zone',
-                    'country': country,
-                    'location': zone['location'],
-                    'drop_zone': zone.get('drop_zone', 'Unknown'),
-                    'site_id': zone['site_id'],
-                    'turnaround_days': zone.get('turnaround_days', self.zone_turnaround_days),
-                    'reentries': zone_reentries.get(zone_key, []),
-                    'prev_month_reentries': zone_prev_reentries.get(zone_key, [])  # For turnaround carry-over
-                })
+            # All zones get a row; inactive ones are hidden by apply_row_visibility()
+            country_zones_map[country].append({
+                'type': 'zone',
+                'country': country,
+                'location': zone['location'],
+                'drop_zone': zone.get('drop_zone', 'Unknown'),
+                'site_id': zone['site_id'],
+                'turnaround_days': turnaround,
+                'active': zone_key in zone_reentries,
+                'reentries': zone_reentries.get(zone_key, []),
+                'prev_month_reentries': zone_prev_reentries.get(zone_key, [])  # For turnaround carry-over
+            })
         
-        # Build rows for display
+        # Build rows for display, including children of collapsed groups
         rows = []
+        self._country_row_ranges = {}
         for country in sorted(country_zones_map.keys()):
             zones = country_zones_map[country]
             country_has_reentries = any(z['reentries'] for z in zones)
@@ -148,15 +177,18 @@ class ReentryTimelineView(QWidget):
             if self.initial_load and country_has_reentries:
                 self.expanded_groups.add(country)
             
-            if zones and (country_has_reentries or not self.show_only_active):
-                rows.append({
-                    'type': 'group',
-                    'country': country,
-                    'expanded': country in self.expanded_groups
-                })
-                
-                if country in self.expanded_groups:
-                    rows.extend(zones)
+            rows.append({
+                'type': 'group',
+                'country': country,
+                'expanded': country in self.expanded_groups,
+                'active': country_has_reentries
+            })
+            
+            start = len(rows)
+            rows.extend(zones)
+            self._country_row_ranges[country] = range(start, len(rows))
+        
+        self._rows = rows
         
         # Mark that initial load is complete
         self.initial_load = False
@@ -192,7 +224,7 @@ class ReentryTimelineView(QWidget):
                 font.setBold(True)
                 font.setPointSize(10)
                 item.setFont(font)
-                item.setBackground(QColor(67, 25, 218))
+                item.setBackground(_GROUP_BG)
                 item.setForeground(Qt.GlobalColor.white)
                 item.setData(Qt.ItemDataRole.UserRole, {'type': 'group', 'country': country})
                 
@@ -202,7 +234,7 @@ class ReentryTimelineView(QWidget):
             else:
                 # Location
                 location_item = QTableWidgetItem(row_data['location'])
-                location_item.setBackground(QColor(240, 240, 245))
+                location_item.setBackground(_HEADER_BG)
                 location_item.setForeground(Qt.GlobalColor.black)
                 self.timeline_table.setItem(row_idx, 0, location_item)
                 
@@ -210,82 +242,84 @@ class ReentryTimelineView(QWidget):
                 turnaround = row_data.get('turnaround_days', self.zone_turnaround_days)
                 zone_text = f"{row_data['drop_zone']} ({turnaround}d)"
                 zone_item = QTableWidgetItem(zone_text)
-                zone_item.setBackground(QColor(240, 240, 245))
+                zone_item.setBackground(_HEADER_BG)
                 zone_item.setForeground(Qt.GlobalColor.black)
                 self.timeline_table.setItem(row_idx, 1, zone_item)
                 
                 # Vehicle components
-                components = set()
-                for reentry in row_data['reentries']:
-                    if reentry.get('vehicle_component'):
-                        components.add(reentry['vehicle_component'])
+                components = {r['vehicle_component'] for r in row_data['reentries'] if r.get('vehicle_component')}
                 
-                vehicle_item = QTableWidgetItem(", ".join(sorted(components)[:2]))
-                vehicle_item.setBackground(QColor(240, 240, 245))
+                vehicle_item = QTableWidgetItem(", ".join(heapq.nsmallest(2, components)))
+                vehicle_item.setBackground(_HEADER_BG)
                 vehicle_item.setForeground(Qt.GlobalColor.black)
                 self.timeline_table.setItem(row_idx, 2, vehicle_item)
                 
+                # Re-entry days and recovery mask, computed once per zone
+                zone_turnaround = row_data['turnaround_days']
+                reentry_days = np.fromiter((int(r['reentry_date'][8:10]) for r in row_data['reentries']),
+                                           dtype=np.int16, count=len(row_data['reentries']))
+                prev_days = np.fromiter((int(r['reentry_date'][8:10]) for r in row_data['prev_month_reentries']),
+                                        dtype=np.int16, count=len(row_data['prev_month_reentries']))
+                
+                # Recovery covers the turnaround days after each re-entry in this month
+                recovery = np.zeros(days_in_month + 1, dtype=bool)
+                for reentry_day in reentry_days:
+                    recovery[reentry_day + 1:reentry_day + zone_turnaround + 1] = True
+                
+                # Plus any previous-month recovery that extends into this month
+                if len(prev_days):
+                    days_past_month_end = int(prev_days.max()) + zone_turnaround - days_in_prev_month
+                    if days_past_month_end > 0:
+                        recovery[1:days_past_month_end + 1] = True
+                
+                # Re-entries keyed by their day, so each cell is a dict lookup
+                reentries_by_day = defaultdict(list)
+                for reentry, reentry_day in zip(row_data['reentries'], reentry_days.tolist()):
+                    reentries_by_day[reentry_day].append(reentry)
+                
                 # Daily cells
                 for col_day in range(1, days_in_month + 1):
                     col_idx = 2 + col_day
                     item = QTableWidgetItem("")
                     
                     # Find re-entries on this day
-                    day_reentries = [r for r in row_data['reentries'] 
-                                    if datetime.strptime(r['reentry_date'], '%Y-%m-%d').day == col_day]
+                    day_hits = reentries_by_day.get(col_day)
                     
-                    if day_reentries:
-                        reentry = day_reentries[0]
+                    if day_hits:
+                        reentry = day_hits[0]
                         status_color = reentry.get('status_color', '#FFFF00')
-                        item.setBackground(QColor(status_color))
-                        item.setText(str(len(day_reentries)))
+                        color = self._status_color_cache.get(status_color)
+                        if color is None:
+                            color = self._status_color_cache[status_color] = QColor(status_color)
+                        item.setBackground(color)
+                        item.setText(str(len(day_hits)))
                         item.setData(Qt.ItemDataRole.UserRole, {
                             'type': 'reentry',
                             'reentry_id': reentry['reentry_id'],
-                            'count': len(day_reentries)
+                            'count': len(day_hits)
                         })
+                    elif recovery[col_day]:
+                        item.setBackground(_RECOVERY)
                     else:
-                        # Check for recovery period using zone-specific turnaround
-                        in_recovery = False
-                        zone_turnaround = row_data.get('turnaround_days', self.zone_turnaround_days)
-                        
-                        # Check re-entries in current month
-                        for reentry in row_data['reentries']:
-                            reentry_day = datetime.strptime(reentry['reentry_date'], '%Y-%m-%d').day
-                            if reentry_day < col_day <= reentry_day + zone_turnaround:
-                                in_recovery = True
-                                break
-                        
-                        # Check re-entries from previous month that might extend into current month
-                        if not in_recovery and row_data.get('prev_month_reentries'):
-                            prev_year = self.current_year
-                            prev_month = self.current_month - 1
-                            if prev_month < 1:
-                                prev_month = 12
-                                prev_year -= 1
-                            
-                            days_in_prev_month = calendar.monthrange(prev_year, prev_month)[1]
-                            
-                            for prev_reentry in row_data['prev_month_reentries']:
-                                prev_reentry_date = datetime.strptime(prev_reentry['reentry_date'], '%Y-%m-%d')
-                                prev_reentry_day = prev_reentry_date.day
-                                
-                                # Calculate how many days into current month the recovery extends
-                                days_past_month_end = (prev_reentry_day + zone_turnaround) - days_in_prev_month
-                                
-                                if days_past_month_end > 0 and col_day <= days_past_month_end:
-                                    in_recovery = True
-                                    break
-                        
-                        if in_recovery:
-                            item.setBackground(QColor(200, 200, 200))
-                        else:
-                            item.setBackground(QColor(255, 255, 255))
+                        item.setBackground(_WHITE)
                     
                     self.timeline_table.setItem(row_idx, col_idx, item)
         
         for row in range(len(rows)):
             self.timeline_table.setRowHeight(row, 30)
+        
+        self.apply_row_visibility()
+    
+    def is_row_hidden(self, row_data: dict) -> bool:
+        """Whether a row is hidden by active-only filtering or a collapsed group"""
+        if self.show_only_active and not row_data['active']:
+            return True
+        return row_data['type'] == 'zone' and row_data['country'] not in self.expanded_groups
+    
+    def apply_row_visibility(self):
+        """Show/hide existing rows without recreating any items"""
+        for row_idx, row_data in enumerate(self._rows):
+            self.timeline_table.setRowHidden(row_idx, self.is_row_hidden(row_data))
     
     def cell_clicked(self, row: int, col: int):
         item = self.timeline_table.item(row, col)
@@ -300,9 +334,14 @@ class ReentryTimelineView(QWidget):
             country = data['country']
             if country in self.expanded_groups:
                 self.expanded_groups.remove(country)
+                expand_icon = "▶"
             else:
                 self.expanded_groups.add(country)
-            self.update_timeline()
+                expand_icon = "▼"
+            item.setText(f"{expand_icon} {country}")
+            
+            for row_idx in self._country_row_ranges.get(country, ()):
+                self.timeline_table.setRowHidden(row_idx, self.is_row_hidden(self._rows[row_idx]))
         
         elif data.get('type') == 'reentry':
             self.reentry_selected.emit(data['reentry_id'])
@@ -323,4 +362,4 @@ class ReentryTimelineView(QWidget):
     
     def toggle_active_only(self, state):
         self.show_only_active = (state == Qt.CheckState.Checked.value)
-        self.update_timeline()
+        self.apply_row_visibility()
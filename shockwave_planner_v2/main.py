@@ -13,7 +13,6 @@ import os
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap
-from gui.main_window import MainWindow
 
 
 def main():
@@ -40,6 +39,9 @@ def main():
         splash.show()
         app.processEvents()
     
+    # Import the GUI stack (matplotlib/cartopy) only once the splash is visible
+    from gui.main_window import MainWindow
+    
     # Create main window
     window = MainWindow()
     
@@ -7,6 +7,54 @@ import sqlite3
 import sys
 import os
 
+def existing_columns(cursor, table):
+    """Column names currently defined on a table"""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+
+def schema_version(conn):
+    """Schema version recorded by a previous repair, or None"""
+    has_meta = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='schema_meta'"
+    ).fetchone()
+    if not has_meta:
+        return None
+    row = conn.execute("SELECT MAX(version) FROM schema_meta").fetchone()
+    return row[0] if row else None
+
+def add_missing_columns(cursor, table, columns):
+    """Add missing (name, type) columns back-to-back, returning the added names"""
+    existing = existing_columns(cursor, table)
+    missing = [(col_name, col_type) for col_name, col_type in columns if col_name not in existing]
+    for col_name, col_type in missing:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}")
+    return {col_name for col_name, _ in missing}
+
+# Bumped whenever this script learns about new columns or tables
+SCHEMA_VERSION = 2
+
+# Default (value, status_name) seeds for newly added launch_status columns
+STATUS_COLORS = [
+    ('#FFFF00', 'Scheduled'),
+    ('#00FF00', 'Go for Launch'),
+    ('#00AA00', 'Success'),
+    ('#FF0000', 'Failure'),
+    ('#FFA500', 'Partial Failure'),
+    ('#808080', 'Scrubbed'),
+    ('#FFAA00', 'Hold'),
+    ('#00AAFF', 'In Flight'),
+]
+
+STATUS_ABBRS = [
+    ('SCH', 'Scheduled'),
+    ('GO', 'Go for Launch'),
+    ('SUC', 'Success'),
+    ('FAIL', 'Failure'),
+    ('PF', 'Partial Failure'),
+    ('SCR', 'Scrubbed'),
+    ('HOLD', 'Hold'),
+    ('FLT', 'In Flight'),
+]
+
 def repair_database(db_path='shockwave_planner.db'):
     """Repair and update database schema"""
     
@@ -23,211 +71,216 @@ def repair_database(db_path='shockwave_planner.db'):
     print(f"Repairing database: {db_path}")
     print()
     
-    # Backup first
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    
+    # Nothing to do if a previous run already brought the schema up to date
+    if schema_version(conn) == SCHEMA_VERSION:
+        conn.close()
+        print("✓ Database schema is already v2.0 - no repairs needed")
+        print()
+        return
+    
+    # Backup first, page by page through SQLite so WAL contents are included
     backup_path = db_path + '.backup'
-    import shutil
-    shutil.copy(db_path, backup_path)
+    bck = sqlite3.connect(backup_path)
+    try:
+        conn.backup(bck, pages=1024)
+    finally:
+        bck.close()
     print(f"✓ Backup created: {backup_path}")
     
-    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA busy_timeout = 5000")
     cursor = conn.cursor()
     
     repairs_made = []
     
-    # Check and add status_color column
-    try:
-        cursor.execute("SELECT status_color FROM launch_status LIMIT 1")
-        print("✓ launch_status.status_color exists")
-    except sqlite3.OperationalError:
-        print("  Adding launch_status.status_color...")
-        cursor.execute("ALTER TABLE launch_status ADD COLUMN status_color TEXT")
-        # Update existing statuses with colors
-        cursor.execute("UPDATE launch_status SET status_color = '#FFFF00' WHERE status_name = 'Scheduled'")
-        cursor.execute("UPDATE launch_status SET status_color = '#00FF00' WHERE status_name = 'Go for Launch'")
-        cursor.execute("UPDATE launch_status SET status_color = '#00AA00' WHERE status_name = 'Success'")
-        cursor.execute("UPDATE launch_status SET status_color = '#FF0000' WHERE status_name = 'Failure'")
-        cursor.execute("UPDATE launch_status SET status_color = '#FFA500' WHERE status_name = 'Partial Failure'")
-        cursor.execute("UPDATE launch_status SET status_color = '#808080' WHERE status_name = 'Scrubbed'")
-        cursor.execute("UPDATE launch_status SET status_color = '#FFAA00' WHERE status_name = 'Hold'")
-        cursor.execute("UPDATE launch_status SET status_color = '#00AAFF' WHERE status_name = 'In Flight'")
-        repairs_made.append("Added status_color column")
-        print("✓ Added launch_status.status_color")
-    
-    # Check and add status_abbr column
-    try:
-        cursor.execute("SELECT status_abbr FROM launch_status LIMIT 1")
-        print("✓ launch_status.status_abbr exists")
-    except sqlite3.OperationalError:
-        print("  Adding launch_status.status_abbr...")
-        cursor.execute("ALTER TABLE launch_status ADD COLUMN status_abbr TEXT")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'SCH' WHERE status_name = 'Scheduled'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'GO' WHERE status_name = 'Go for Launch'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'SUC' WHERE status_name = 'Success'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'FAIL' WHERE status_name = 'Failure'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'PF' WHERE status_name = 'Partial Failure'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'SCR' WHERE status_name = 'Scrubbed'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'HOLD' WHERE status_name = 'Hold'")
-        cursor.execute("UPDATE launch_status SET status_abbr = 'FLT' WHERE status_name = 'In Flight'")
-        repairs_made.append("Added status_abbr column")
-        print("✓ Added launch_status.status_abbr")
+    # Per-check status lines are collected and written out in one go
+    log = []
+    say = log.append
     
-    # Check and add description column
+    # One transaction for every ALTER/UPDATE/CREATE, committed with a single sync
     try:
-        cursor.execute("SELECT description FROM launch_status LIMIT 1")
-        print("✓ launch_status.description exists")
-    except sqlite3.OperationalError:
-        print("  Adding launch_status.description...")
-        cursor.execute("ALTER TABLE launch_status ADD COLUMN description TEXT")
-        repairs_made.append("Added description column")
-        print("✓ Added launch_status.description")
-    
-    # Check and add launches columns
-    launches_columns = [
-        ('launch_date', 'DATE'),
-        ('launch_time', 'TIME'),
-        ('launch_window_start', 'DATETIME'),
-        ('launch_window_end', 'DATETIME'),
-        ('site_id', 'INTEGER'),
-        ('rocket_id', 'INTEGER'),
-        ('vehicle_id', 'INTEGER'),
-        ('mission_name', 'TEXT'),
-        ('payload_name', 'TEXT'),
-        ('payload_mass', 'REAL'),
-        ('orbit_type', 'TEXT'),
-        ('orbit_altitude', 'REAL'),
-        ('inclination', 'REAL'),
-        ('status_id', 'INTEGER'),
-        ('success', 'BOOLEAN'),
-        ('failure_reason', 'TEXT'),
-        ('remarks', 'TEXT'),
-        ('source_url', 'TEXT'),
-        ('last_updated', 'DATETIME'),
-        ('notam_reference', 'TEXT'),
-        ('data_source', 'TEXT DEFAULT "MANUAL"'),
-        ('external_id', 'TEXT'),
-        ('last_synced', 'DATETIME'),
-    ]
-    
-    for col_name, col_type in launches_columns:
-        try:
-            cursor.execute(f"SELECT {col_name} FROM launches LIMIT 1")
-            print(f"✓ launches.{col_name} exists")
-        except sqlite3.OperationalError:
-            print(f"  Adding launches.{col_name}...")
-            # Handle DEFAULT in column type
-            if 'DEFAULT' in col_type.upper():
-                cursor.execute(f"ALTER TABLE launches ADD COLUMN {col_name} {col_type}")
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            
+            status_cols = existing_columns(cursor, 'launch_status')
+            
+            # Check and add status_color column
+            if 'status_color' in status_cols:
+                say("✓ launch_status.status_color exists")
             else:
-                cursor.execute(f"ALTER TABLE launches ADD COLUMN {col_name} {col_type}")
-            repairs_made.append(f"Added launches.{col_name}")
-            print(f"✓ Added launches.{col_name}")
-    
-    # Check and add site columns
-    site_columns = [
-        ('latitude', 'REAL'),
-        ('longitude', 'REAL'),
-        ('country', 'TEXT'),
-        ('site_type', 'TEXT DEFAULT "LAUNCH"'),
-        ('external_id', 'TEXT'),
-    ]
-    
-    for col_name, col_type in site_columns:
-        try:
-            cursor.execute(f"SELECT {col_name} FROM launch_sites LIMIT 1")
-            print(f"✓ launch_sites.{col_name} exists")
-        except sqlite3.OperationalError:
-            print(f"  Adding launch_sites.{col_name}...")
-            cursor.execute(f"ALTER TABLE launch_sites ADD COLUMN {col_name} {col_type}")
-            repairs_made.append(f"Added launch_sites.{col_name}")
-            print(f"✓ Added launch_sites.{col_name}")
-    
-    # Check and add rocket columns
-    rocket_columns = [
-        ('family', 'TEXT'),
-        ('variant', 'TEXT'),
-        ('manufacturer', 'TEXT'),
-        ('country', 'TEXT'),
-        ('payload_leo', 'INTEGER'),
-        ('payload_gto', 'INTEGER'),
-        ('height', 'REAL'),
-        ('diameter', 'REAL'),
-        ('mass', 'REAL'),
-        ('stages', 'INTEGER'),
-        ('external_id', 'TEXT'),
-    ]
-    
-    for col_name, col_type in rocket_columns:
-        try:
-            cursor.execute(f"SELECT {col_name} FROM rockets LIMIT 1")
-            print(f"✓ rockets.{col_name} exists")
-        except sqlite3.OperationalError:
-            print(f"  Adding rockets.{col_name}...")
-            cursor.execute(f"ALTER TABLE rockets ADD COLUMN {col_name} {col_type}")
-            repairs_made.append(f"Added rockets.{col_name}")
-            print(f"✓ Added rockets.{col_name}")
-    
-    # Create new tables if they don't exist
-    
-    # Reentry sites
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reentry_sites (
-            reentry_site_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            location TEXT NOT NULL,
-            drop_zone TEXT NOT NULL,
-            latitude REAL,
-            longitude REAL,
-            country TEXT,
-            zone_type TEXT,
-            external_id TEXT,
-            UNIQUE(location, drop_zone)
-        )
-    """)
-    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='reentry_sites'")
-    if cursor.fetchone()[0] > 0:
-        print("✓ reentry_sites table exists")
-    
-    # Reentries
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reentries (
-            reentry_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            launch_id INTEGER,
-            reentry_date DATE,
-            reentry_time TIME,
-            reentry_site_id INTEGER,
-            vehicle_component TEXT,
-            reentry_type TEXT,
-            status_id INTEGER,
-            remarks TEXT,
-            data_source TEXT DEFAULT 'MANUAL',
-            external_id TEXT,
-            FOREIGN KEY (launch_id) REFERENCES launches(launch_id),
-            FOREIGN KEY (reentry_site_id) REFERENCES reentry_sites(reentry_site_id),
-            FOREIGN KEY (status_id) REFERENCES launch_status(status_id)
-        )
-    """)
-    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='reentries'")
-    if cursor.fetchone()[0] > 0:
-        print("✓ reentries table exists")
-    
-    # Sync log
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sync_log (
-            sync_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sync_time DATETIME DEFAULT CURRENT_TIMESTAMP,
-            data_source TEXT,
-            records_added INTEGER,
-            records_updated INTEGER,
-            status TEXT,
-            error_message TEXT
-        )
-    """)
-    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='sync_log'")
-    if cursor.fetchone()[0] > 0:
-        print("✓ sync_log table exists")
-    
-    # Commit all changes
-    conn.commit()
-    conn.close()
+                say("  Adding launch_status.status_color...")
+                cursor.execute("ALTER TABLE launch_status ADD COLUMN status_color TEXT")
+                # Update existing statuses with colors
+                cursor.executemany("UPDATE launch_status SET status_color = ? WHERE status_name = ?", STATUS_COLORS)
+                repairs_made.append("Added status_color column")
+                say("✓ Added launch_status.status_color")
+            
+            # Check and add status_abbr column
+            if 'status_abbr' in status_cols:
+                say("✓ launch_status.status_abbr exists")
+            else:
+                say("  Adding launch_status.status_abbr...")
+                cursor.execute("ALTER TABLE launch_status ADD COLUMN status_abbr TEXT")
+                cursor.executemany("UPDATE launch_status SET status_abbr = ? WHERE status_name = ?", STATUS_ABBRS)
+                repairs_made.append("Added status_abbr column")
+                say("✓ Added launch_status.status_abbr")
+            
+            # Check and add description column
+            if 'description' in status_cols:
+                say("✓ launch_status.description exists")
+            else:
+                say("  Adding launch_status.description...")
+                cursor.execute("ALTER TABLE launch_status ADD COLUMN description TEXT")
+                repairs_made.append("Added description column")
+                say("✓ Added launch_status.description")
+            
+            # Check and add launches columns
+            launches_columns = [
+                ('launch_date', 'DATE'),
+                ('launch_time', 'TIME'),
+                ('launch_window_start', 'DATETIME'),
+                ('launch_window_end', 'DATETIME'),
+                ('site_id', 'INTEGER'),
+                ('rocket_id', 'INTEGER'),
+                ('vehicle_id', 'INTEGER'),
+                ('mission_name', 'TEXT'),
+                ('payload_name', 'TEXT'),
+                ('payload_mass', 'REAL'),
+                ('orbit_type', 'TEXT'),
+                ('orbit_altitude', 'REAL'),
+                ('inclination', 'REAL'),
+                ('status_id', 'INTEGER'),
+                ('success', 'BOOLEAN'),
+                ('failure_reason', 'TEXT'),
+                ('remarks', 'TEXT'),
+                ('source_url', 'TEXT'),
+                ('last_updated', 'DATETIME'),
+                ('notam_reference', 'TEXT'),
+                ('data_source', 'TEXT DEFAULT "MANUAL"'),
+                ('external_id', 'TEXT'),
+                ('last_synced', 'DATETIME'),
+            ]
+            
+            added = add_missing_columns(cursor, 'launches', launches_columns)
+            for col_name, _ in launches_columns:
+                if col_name in added:
+                    repairs_made.append(f"Added launches.{col_name}")
+                    say(f"✓ Added launches.{col_name}")
+                else:
+                    say(f"✓ launches.{col_name} exists")
+            
+            # Check and add site columns
+            site_columns = [
+                ('latitude', 'REAL'),
+                ('longitude', 'REAL'),
+                ('country', 'TEXT'),
+                ('site_type', 'TEXT DEFAULT "LAUNCH"'),
+                ('external_id', 'TEXT'),
+            ]
+            
+            added = add_missing_columns(cursor, 'launch_sites', site_columns)
+            for col_name, _ in site_columns:
+                if col_name in added:
+                    repairs_made.append(f"Added launch_sites.{col_name}")
+                    say(f"✓ Added launch_sites.{col_name}")
+                else:
+                    say(f"✓ launch_sites.{col_name} exists")
+            
+            # Check and add rocket columns
+            rocket_columns = [
+                ('family', 'TEXT'),
+                ('variant', 'TEXT'),
+                ('manufacturer', 'TEXT'),
+                ('country', 'TEXT'),
+                ('payload_leo', 'INTEGER'),
+                ('payload_gto', 'INTEGER'),
+                ('height', 'REAL'),
+                ('diameter', 'REAL'),
+                ('mass', 'REAL'),
+                ('stages', 'INTEGER'),
+                ('external_id', 'TEXT'),
+            ]
+            
+            added = add_missing_columns(cursor, 'rockets', rocket_columns)
+            for col_name, _ in rocket_columns:
+                if col_name in added:
+                    repairs_made.append(f"Added rockets.{col_name}")
+                    say(f"✓ Added rockets.{col_name}")
+                else:
+                    say(f"✓ rockets.{col_name} exists")
+            
+            # Create new tables if they don't exist
+            
+            # Reentry sites
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reentry_sites (
+                    reentry_site_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    location TEXT NOT NULL,
+                    drop_zone TEXT NOT NULL,
+                    latitude REAL,
+                    longitude REAL,
+                    country TEXT,
+                    zone_type TEXT,
+                    external_id TEXT,
+                    UNIQUE(location, drop_zone)
+                )
+            """)
+            cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='reentry_sites'")
+            if cursor.fetchone()[0] > 0:
+                say("✓ reentry_sites table exists")
+            
+            # Reentries
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reentries (
+                    reentry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    launch_id INTEGER,
+                    reentry_date DATE,
+                    reentry_time TIME,
+                    reentry_site_id INTEGER,
+                    vehicle_component TEXT,
+                    reentry_type TEXT,
+                    status_id INTEGER,
+                    remarks TEXT,
+                    data_source TEXT DEFAULT 'MANUAL',
+                    external_id TEXT,
+                    FOREIGN KEY (launch_id) REFERENCES launches(launch_id),
+                    FOREIGN KEY (reentry_site_id) REFERENCES reentry_sites(reentry_site_id),
+                    FOREIGN KEY (status_id) REFERENCES launch_status(status_id)
+                )
+            """)
+            cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='reentries'")
+            if cursor.fetchone()[0] > 0:
+                say("✓ reentries table exists")
+            
+            # Sync log
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sync_log (
+                    sync_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sync_time DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    data_source TEXT,
+                    records_added INTEGER,
+                    records_updated INTEGER,
+                    status TEXT,
+                    error_message TEXT
+                )
+            """)
+            cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='sync_log'")
+            if cursor.fetchone()[0] > 0:
+                say("✓ sync_log table exists")
+            
+            # Record the schema version so later runs can skip straight out
+            cursor.execute("CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER)")
+            cursor.execute("DELETE FROM schema_meta")
+            cursor.execute("INSERT INTO schema_meta (version) VALUES (?)", (SCHEMA_VERSION,))
+    finally:
+        conn.close()
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
     
     print()
     print("=" * 60)
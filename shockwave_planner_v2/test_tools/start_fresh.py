@@ -9,7 +9,6 @@ Use this if:
 - The repair script isn't working
 """
 import os
-import shutil
 import sys
 
 def start_fresh():
@@ -52,19 +51,20 @@ def start_fresh():
     
     print()
     print(f"Backing up old database to: {backup_name}")
-    shutil.copy(db_file, backup_name)
+    # A rename both backs up and removes the old database without copying it
+    os.replace(db_file, backup_name)
     print("✓ Backup created")
-    
-    # Delete database
-    print("Deleting old database...")
-    os.remove(db_file)
     print("✓ Old database deleted")
     
-    # Also remove journal if it exists
-    journal_file = db_file + '-journal'
-    if os.path.exists(journal_file):
-        os.remove(journal_file)
-        print("✓ Removed database journal")
+    # Move any WAL/journal along with it so the backup stays consistent
+    for suffix in ('-wal', '-journal'):
+        if os.path.exists(db_file + suffix):
+            os.replace(db_file + suffix, backup_name + suffix)
+            print(f"✓ Moved database {suffix[1:]} to backup")
+    
+    # The shared-memory index is rebuilt on open
+    if os.path.exists(db_file + '-shm'):
+        os.remove(db_file + '-shm')
     
     print()
     print("=" * 60)
@@ -7,6 +7,7 @@ This tests the Space Devs API without needing the full application.
 """
 import sys
 import os
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -22,113 +23,99 @@ def test_api():
     print("=" * 60)
     print()
     
-    # Create temporary database
-    print("Creating temporary database...")
-    db = LaunchDatabase('test_api.db')
-    print("✓ Database created")
-    print()
-    
-    # Create API client
-    print("Creating API client...")
-    api = SpaceDevsAPI(db)
-    print("✓ API client created")
-    print()
-    
-    # Test fetching upcoming launches (just a few)
-    print("Testing API fetch (this will take ~10 seconds)...")
-    print()
-    
-    try:
-        # Fetch just first page (10 launches)
-        from datetime import datetime, timedelta
-        now = datetime.utcnow()
-        future = now + timedelta(days=30)
-        
-        params = {
-            "net__gte": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "net__lte": future.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "limit": 10,
-            "mode": "detailed",
-            "ordering": "net"
-        }
-        
-        launches = api.fetch_launches(params)
-        
-        # Close database connection BEFORE trying to delete
-        db.close()
-        
-        if launches:
-            print()
-            print("=" * 60)
-            print("✅ SUCCESS! API is working!")
-            print("=" * 60)
-            print(f"Fetched {len(launches)} launches")
+    # Create temporary database; the directory is removed once the connection is closed
+    # (a file Windows still holds locked is left behind rather than failing the test)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        print("Creating temporary database...")
+        db = LaunchDatabase(os.path.join(temp_dir, 'test_api.db'))
+        try:
+            print("✓ Database created")
             print()
-            print("Sample launches:")
-            print("-" * 60)
-            for i, launch in enumerate(launches[:3], 1):
-                name = launch.get('name', 'Unknown')
-                net = launch.get('net', 'Unknown')
-                status = launch.get('status', {}).get('name', 'Unknown')
-                print(f"{i}. {name}")
-                print(f"   Date: {net}")
-                print(f"   Status: {status}")
-                print()
             
-            print("-" * 60)
-            print()
-            print("The Space Devs API is working correctly!")
-            print("You can now use: Data → Sync Upcoming Launches")
+            # Create API client
+            print("Creating API client...")
+            api = SpaceDevsAPI(db)
+            print("✓ API client created")
             print()
             
-            # Clean up - add retry for Windows
-            import time
-            for attempt in range(3):
-                try:
-                    if os.path.exists('test_api.db'):
-                        os.remove('test_api.db')
-                    if os.path.exists('test_api.db-journal'):
-                        os.remove('test_api.db-journal')
-                    break
-                except PermissionError:
-                    if attempt < 2:
-                        time.sleep(0.5)  # Wait for Windows to release the file
-                    else:
-                        print("Note: Could not delete test_api.db (file locked)")
-                        print("You can safely delete it manually if you wish.")
-            
-            return True
-            
-        else:
-            print()
-            print("=" * 60)
-            print("⚠️  WARNING: No launches returned")
-            print("=" * 60)
+            # Test fetching upcoming launches (just a few)
+            print("Testing API fetch (this will take ~10 seconds)...")
             print()
-            print("This could mean:")
-            print("  1. You're being rate limited (wait 60 seconds)")
-            print("  2. Network connectivity issue")
-            print("  3. API endpoint changed")
-            print()
-            return False
             
-    except Exception as e:
-        print()
-        print("=" * 60)
-        print("❌ ERROR")
-        print("=" * 60)
-        print(f"Error: {e}")
-        print()
-        print("Possible issues:")
-        print("  1. No internet connection")
-        print("  2. Firewall blocking requests")
-        print("  3. Space Devs API is down")
-        print()
-        
-        import traceback
-        traceback.print_exc()
-        
-        return False
+            try:
+                # Fetch just first page (10 launches)
+                from datetime import datetime, timedelta
+                now = datetime.utcnow()
+                future = now + timedelta(days=30)
+                
+                params = {
+                    "net__gte": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "net__lte": future.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "limit": 10,
+                    "mode": "detailed",
+                    "ordering": "net"
+                }
+                
+                launches = api.fetch_launches(params)
+                
+                if launches:
+                    print()
+                    print("=" * 60)
+                    print("✅ SUCCESS! API is working!")
+                    print("=" * 60)
+                    print(f"Fetched {len(launches)} launches")
+                    print()
+                    print("Sample launches:")
+                    print("-" * 60)
+                    for i, launch in enumerate(launches[:3], 1):
+                        name = launch.get('name', 'Unknown')
+                        net = launch.get('net', 'Unknown')
+                        status = launch.get('status', {}).get('name', 'Unknown')
+                        print(f"{i}. {name}")
+                        print(f"   Date: {net}")
+                        print(f"   Status: {status}")
+                        print()
+                    
+                    print("-" * 60)
+                    print()
+                    print("The Space Devs API is working correctly!")
+                    print("You can now use: Data → Sync Upcoming Launches")
+                    print()
+                    
+                    return True
+                
+                else:
+                    print()
+                    print("=" * 60)
+                    print("⚠️  WARNING: No launches returned")
+                    print("=" * 60)
+                    print()
+                    print("This could mean:")
+                    print("  1. You're being rate limited (wait 60 seconds)")
+                    print("  2. Network connectivity issue")
+                    print("  3. API endpoint changed")
+                    print()
+                    return False
+            
+            except Exception as e:
+                print()
+                print("=" * 60)
+                print("❌ ERROR")
+                print("=" * 60)
+                print(f"Error: {e}")
+                print()
+                print("Possible issues:")
+                print("  1. No internet connection")
+                print("  2. Firewall blocking requests")
+                print("  3. Space Devs API is down")
+                print()
+                
+                import traceback
+                traceback.print_exc()
+                
+                return False
+        finally:
+            db.close()
 
 if __name__ == '__main__':
     try:
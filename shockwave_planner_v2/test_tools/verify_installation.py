@@ -3,25 +3,28 @@
 SHOCKWAVE PLANNER v2.0 - Verification Test
 Quick test to verify installation and basic functionality
 """
+import importlib.util
+import io
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add current directory to path once for the module/database tests
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def test_imports():
-    """Test required imports"""
+    """Test required packages are installed (without importing them)"""
     print("Testing imports...")
-    try:
-        import PyQt6
-        print("  ✓ PyQt6 found")
-    except ImportError:
+    if importlib.util.find_spec("PyQt6") is None:
         print("  ✗ PyQt6 NOT found - Install with: pip install PyQt6 --break-system-packages")
         return False
+    print("  ✓ PyQt6 found")
     
-    try:
-        import requests
-        print("  ✓ requests found")
-    except ImportError:
+    if importlib.util.find_spec("requests") is None:
         print("  ✗ requests NOT found - Install with: pip install requests --break-system-packages")
         return False
+    print("  ✓ requests found")
     
     return True
 
@@ -29,9 +32,6 @@ def test_modules():
     """Test application modules"""
     print("\nTesting modules...")
     
-    # Add current directory to path
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    
     try:
         from data.database import LaunchDatabase
         print("  ✓ database module")
@@ -80,8 +80,6 @@ def test_database():
     """Test database functionality"""
     print("\nTesting database...")
     
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    
     try:
         from data.database import LaunchDatabase
         
@@ -134,9 +132,20 @@ def test_files():
         'PROJECT_SUMMARY_v2.md',
     ]
     
+    # List each directory once instead of stat-ing every file
+    present = set()
+    scanned = set()
+    for directory in {os.path.dirname(file) for file in required_files}:
+        try:
+            with os.scandir(directory or '.') as entries:
+                present.update(os.path.join(directory, entry.name).replace(os.sep, '/') for entry in entries)
+            scanned.add(directory)
+        except OSError:
+            pass
+    
     all_found = True
     for file in required_files:
-        if os.path.exists(file):
+        if file in present or (os.path.dirname(file) not in scanned and os.path.exists(file)):
             print(f"  ✓ {file}")
         else:
             print(f"  ✗ {file} MISSING")
@@ -144,19 +153,55 @@ def test_files():
     
     return all_found
 
+class ThreadStdout:
+    """stdout proxy that sends each worker thread's prints to its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def run_captured(self, test):
+        """Run a test, returning (passed, captured output)"""
+        self.local.buffer = io.StringIO()
+        try:
+            return test(), self.local.buffer.getvalue()
+        finally:
+            self.local.buffer = None
+
 def main():
     print("=" * 60)
     print("SHOCKWAVE PLANNER v2.0 - Verification Test")
     print("=" * 60)
     print()
     
-    results = []
+    tests = [
+        ("Imports", test_imports),
+        ("File Structure", test_files),
+        ("Modules", test_modules),
+        ("Database", test_database),
+    ]
     
-    # Run tests
-    results.append(("Imports", test_imports()))
-    results.append(("File Structure", test_files()))
-    results.append(("Modules", test_modules()))
-    results.append(("Database", test_database()))
+    # Run tests concurrently, then print their output in the usual order
+    stdout = ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            futures = [(name, ex.submit(stdout.run_captured, test)) for name, test in tests]
+            outcomes = [(name, future.result()) for name, future in futures]
+    finally:
+        sys.stdout = stdout.stream
+    
+    results = []
+    for name, (passed, output) in outcomes:
+        sys.stdout.write(output)
+        results.append((name, passed))
     
     # Summary
     print("\n" + "=" * 60)